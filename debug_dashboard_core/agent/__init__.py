@@ -8,8 +8,17 @@ Agent is opt-in: only active when config has agent.enabled = true.
 """
 from enum import Enum
 
+try:
+    from enum import StrEnum
+except ImportError:  # Python 3.10
+    class StrEnum(str, Enum):
+        """Backport of enum.StrEnum (3.11+): members are real str instances."""
 
-class AgentState(Enum):
+        def __str__(self) -> str:
+            return self.value
+
+
+class AgentState(StrEnum):
     IDLE = "idle"
     OBSERVING = "observing"
     REASONING = "reasoning"
@@ -0,0 +1,96 @@
+"""NotifiableDeque — lightweight single-consumer event queue.
+
+queue.Queue takes a mutex and signals a Condition on every put/get. The agent
+bus has exactly one consumer per queue (the AgentLoop thread, or one SSE
+generator per client), so a deque is enough: append/popleft are atomic under
+the GIL, and a threading.Event is only touched to wake a consumer that is
+actually waiting.
+"""
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Iterable, List, Optional
+
+
+class NotifiableDeque:
+    """deque + Event with a queue.Queue-like put/get surface.
+
+    - put() never blocks; with maxlen set, the oldest item is dropped when full
+    - get() raises queue.Empty on timeout, like queue.Queue.get
+    - Safe for any number of producers and ONE consumer
+    """
+
+    __slots__ = ("_items", "_ready")
+
+    def __init__(self, maxlen: Optional[int] = None):
+        self._items: deque = deque(maxlen=maxlen)
+        self._ready = threading.Event()
+
+    def put(self, item: Any):
+        self._items.append(item)
+        # Event.set() takes the Event's internal lock — skip it while a wakeup
+        # is already pending. Safe because the consumer clears the flag
+        # *before* re-checking the deque (see get()).
+        if not self._ready.is_set():
+            self._ready.set()
+
+    def put_many(self, items: Iterable[Any]):
+        """Append a batch with a single wakeup."""
+        self._items.extend(items)
+        if not self._ready.is_set():
+            self._ready.set()
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """Pop the oldest item, waiting up to `timeout` seconds for one."""
+        items = self._items
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return items.popleft()
+            except IndexError:
+                pass
+            # Clear, then re-check: a put() landing after the clear re-sets
+            # the event, so the wakeup can't be lost
+            self._ready.clear()
+            if items:
+                continue
+            if deadline is None:
+                self._ready.wait()
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._ready.wait(remaining):
+                try:
+                    return items.popleft()
+                except IndexError:
+                    raise queue.Empty from None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until something is queued (without popping it); False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._items:
+            self._ready.clear()
+            if self._items:
+                break
+            if deadline is None:
+                self._ready.wait()
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._ready.wait(remaining):
+                return bool(self._items)
+        return True
+
+    def drain(self) -> List[Any]:
+        """Pop everything currently queued without waiting (consumer side)."""
+        items = self._items
+        out: List[Any] = []
+        try:
+            while True:
+                out.append(items.popleft())
+        except IndexError:
+            return out
+
+    # No __len__ on purpose: like queue.Queue, an empty queue must stay truthy
+    # (callers test `if not sink` for "not configured").
+    def qsize(self) -> int:
+        return len(self._items)
@@ -1,11 +1,34 @@
-"""Agent event types and data classes."""
+"""Agent event types and data classes.
+
+Dataclasses are slotted (created per event — smaller instances, faster access).
+Event payloads stay plain dicts (cheap literals, serialize directly); the
+TypedDicts below document the shape of the hot ones for static checking.
+"""
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, TypedDict
+
+try:
+    import orjson  # optional C-accelerated JSON (falls back to stdlib json)
+except ImportError:
+    orjson = None
+
+from . import StrEnum
+
+
+def _dumps(obj) -> str:
+    """Compact JSON text for event payloads (orjson when installed)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, default=str).decode("utf-8")
+        except TypeError:
+            pass  # e.g. int > 64-bit — let stdlib json handle it
+    return json.dumps(obj, ensure_ascii=False, default=str, separators=(",", ":"))
 
 
-class EventType(Enum):
+class EventType(StrEnum):
+    """Event kinds. StrEnum members compare and JSON-encode as plain strings."""
     FILE_CHANGED = "file_changed"
     FILE_CREATED = "file_created"
     FILE_DELETED = "file_deleted"
@@ -20,7 +43,7 @@ class EventType(Enum):
     INSIGHT_GENERATED = "insight_generated"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentEvent:
     """Core event flowing through the agent pipeline."""
     type: EventType
@@ -28,9 +51,75 @@ class AgentEvent:
     data: Dict[str, Any] = field(default_factory=dict)
     source: str = ""          # "watcher", "user", "reasoner", "executor"
     workspace_id: str = ""    # GPT 리스크 #2: 모든 이벤트에 workspace_id 포함
+    _timestamp_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _data_json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _wire_bytes: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+
+    def timestamp_iso(self) -> str:
+        """ISO-8601 text of `timestamp`, formatted once for memory + SSE."""
+        if self._timestamp_iso is None:
+            self._timestamp_iso = self.timestamp.isoformat()
+        return self._timestamp_iso
+
+    def data_json(self) -> str:
+        """JSON text of `data`, serialized once and shared by storage + SSE.
+
+        Payloads are treated as immutable once emitted.
+        """
+        if self._data_json is None:
+            self._data_json = _dumps(self.data)
+        return self._data_json
+
+    def wire_bytes(self) -> bytes:
+        """UTF-8 SSE wire JSON ({type, timestamp, source, workspace_id, data}).
+
+        Encoded once per event and shared by every SSE client, already as the
+        bytes that go on the socket; the payload part reuses data_json().
+        """
+        if self._wire_bytes is None:
+            envelope = _dumps({
+                "type": self.type.value,
+                "timestamp": self.timestamp_iso(),
+                "source": self.source,
+                "workspace_id": self.workspace_id,
+            })
+            self._wire_bytes = f'{envelope[:-1]},"data":{self.data_json()}}}'.encode("utf-8")
+        return self._wire_bytes
+
+
+class ScanCompletedData(TypedDict):
+    """AgentEvent.data for a SCAN_COMPLETED event from a scan that ran."""
+    scan_id: str
+    scan_timestamp: str
+    reports: Dict[str, dict]
+    overall: str              # "HEALTHY" | "DEGRADED" | "CRITICAL"
+    total_pass: int
+    total_warn: int
+    total_fail: int
+    health_pct: float
+    has_critical: bool
+    failing_checkers: List[str]
+    checker_names: List[str]
+    cache_hits: List[str]
+    duration_ms: int
+
+
+class LLMAnalysisData(TypedDict):
+    """AgentEvent.data for a successful LLM_ANALYSIS_COMPLETED event."""
+    checker: str
+    analysis: str
+    root_causes: List[str]
+    fix_suggestions: List[Dict]
+    model: str
+    cost_usd: float
+    tokens: Dict[str, int]
+    evidence: Dict[str, Any]
+    report_hash: str
+    analysis_timestamp: str
+    report_was_fresh: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class FileChangeEvent:
     """Detail of a single file change detected by the observer."""
     path: str
@@ -39,7 +128,7 @@ class FileChangeEvent:
     relative_to_root: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMAnalysis:
     """Result of an LLM deep analysis (Tier 2)."""
     request_id: str
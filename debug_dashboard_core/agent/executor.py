@@ -4,30 +4,59 @@ GPT Risk #6 addressed: execution lock prevents concurrent checker runs.
 Agent auto-fix scope limited to "none" or "todo_markers" (never destructive).
 
 Lock Policy (GPT Review #3F):
-  - ONE scan at a time per workspace (full serialization via threading.Lock)
+  - ONE scan at a time per workspace (full serialization via asyncio.Lock)
   - If a scan is in progress, new scan requests return immediately with skipped=True
   - LLM analysis runs outside the scan lock (can overlap with next scan)
   - This is the simplest/safest policy — prevents race conditions at cost of latency
   - Future: per-checker locking if fine-grained concurrency is needed
+
+Concurrency model:
+  execute() is a coroutine driven by the AgentLoop's event loop. Blocking work
+  (checker.run, LLM HTTP calls) is pushed to worker threads via asyncio.to_thread
+  so the event loop itself never blocks. Within a scan, checkers in the same
+  dependency level run concurrently (asyncio.gather); levels run in order.
 """
 import re
 import time
+import asyncio
 import hashlib
 import json
-import threading
 import logging
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+try:
+    import orjson  # optional C-accelerated JSON (falls back to stdlib json)
+except ImportError:
+    orjson = None
 
 from ..scanner.base import BaseChecker, CheckResult, PhaseReport
-from .events import AgentEvent, EventType, LLMAnalysis
+from .events import AgentEvent, EventType, LLMAnalysis, LLMAnalysisData, ScanCompletedData
 from .graph import CheckerDependencyGraph
 from .reasoner import Action
 
 logger = logging.getLogger("agent.executor")
 
 
+def _dumps_sorted(obj) -> str:
+    """Compact, key-sorted JSON used as hash input.
+
+    Uses orjson when installed; the stdlib fallback emits the same compact
+    separators so hashes stay comparable with or without orjson.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str,
+            ).decode("utf-8")
+        except TypeError:
+            pass  # e.g. int > 64-bit — let stdlib json handle it
+    return json.dumps(obj, sort_keys=True, ensure_ascii=False, default=str,
+                      separators=(",", ":"))
+
+
 class Executor:
     """Executes actions decided by the Reasoner.
 
@@ -44,50 +73,75 @@ class Executor:
         dep_graph: CheckerDependencyGraph,
         llm_provider=None,
         workspace_id: str = "",
+        llm_timeout_seconds: float = 90.0,
     ):
         self._checkers = checkers
+        # Frozen once so the dependency graph's memo key hashes it only once
+        self._available = frozenset(checkers)
         self._project_root = project_root
         self._config = config
         self._dep_graph = dep_graph
         self._llm = llm_provider
         self._workspace_id = workspace_id
         # GPT Risk #6: execution lock — prevents concurrent checker runs
-        self._execution_lock = threading.Lock()
+        self._execution_lock = asyncio.Lock()
         self._executing = False
+        # Checker result cache: name → (config hash + input fingerprint, report dict).
+        # Only used by checkers that implement BaseChecker.input_fingerprint().
+        self._result_cache: Dict[str, Tuple[str, dict]] = {}
+        # Report hash memo: id(report) → (report, timestamp, hash). Holding the
+        # report keeps its id from being reused while the entry is alive.
+        self._hash_cache: "OrderedDict[int, Tuple[dict, object, str]]" = OrderedDict()
+        # Upper bound on one LLM analysis (primary + fallback); <= 0 disables it
+        self._llm_timeout = llm_timeout_seconds if llm_timeout_seconds > 0 else None
+        # action_type → handler coroutine (built once; replaces an if/elif chain)
+        self._dispatch: Dict[str, Callable[[Action], Awaitable[AgentEvent]]] = {
+            "run_checkers": self._handle_run_checkers,
+            "llm_analyze": self._handle_llm_analyze,
+            "emit_insights": self._emit_insights,
+        }
 
     @property
     def is_executing(self) -> bool:
         return self._executing
 
-    def execute(self, action: Action) -> AgentEvent:
+    async def execute(self, action: Action) -> AgentEvent:
         """Execute a single action and return a result event."""
-        if action.action_type == "run_checkers":
-            return self._run_checkers(action.checker_names)
-        elif action.action_type == "llm_analyze":
-            return self._execute_llm_analysis(
-                action.data.get("checker", ""),
-                action.data.get("report"),
-            )
-        elif action.action_type == "emit_insights":
-            return AgentEvent(
-                type=EventType.INSIGHT_GENERATED,
-                data=action.data,
-                source="executor",
-                workspace_id=self._workspace_id,
-            )
-        else:
-            logger.warning(f"Unknown action type: {action.action_type}")
-            return AgentEvent(
-                type=EventType.AGENT_STATE_CHANGED,
-                data={"error": f"Unknown action: {action.action_type}"},
-                source="executor",
-                workspace_id=self._workspace_id,
-            )
+        handler = self._dispatch.get(action.action_type)
+        if handler is None:
+            return self._unknown(action)
+        return await handler(action)
+
+    async def _handle_run_checkers(self, action: Action) -> AgentEvent:
+        return await self._run_checkers(action.checker_names)
+
+    async def _handle_llm_analyze(self, action: Action) -> AgentEvent:
+        return await self._execute_llm_analysis(
+            action.data.get("checker", ""),
+            action.data.get("report"),
+        )
+
+    async def _emit_insights(self, action: Action) -> AgentEvent:
+        return AgentEvent(
+            type=EventType.INSIGHT_GENERATED,
+            data=action.data,
+            source="executor",
+            workspace_id=self._workspace_id,
+        )
+
+    def _unknown(self, action: Action) -> AgentEvent:
+        logger.warning(f"Unknown action type: {action.action_type}")
+        return AgentEvent(
+            type=EventType.AGENT_STATE_CHANGED,
+            data={"error": f"Unknown action: {action.action_type}"},
+            source="executor",
+            workspace_id=self._workspace_id,
+        )
 
-    def _run_checkers(self, checker_names: List[str]) -> AgentEvent:
+    async def _run_checkers(self, checker_names: List[str]) -> AgentEvent:
         """Run checkers in dependency order with execution lock."""
-        # GPT Risk #6: prevent concurrent checker runs
-        if not self._execution_lock.acquire(blocking=False):
+        # GPT Risk #6: prevent concurrent checker runs (skip instead of queueing)
+        if self._execution_lock.locked():
             logger.info("Scan already in progress, skipping")
             return AgentEvent(
                 type=EventType.SCAN_COMPLETED,
@@ -96,42 +150,42 @@ class Executor:
                 workspace_id=self._workspace_id,
             )
 
+        await self._execution_lock.acquire()
         try:
             self._executing = True
-            # Resolve execution order via dependency graph
-            # Filter to only available checkers
-            available_names = [n for n in checker_names if n in self._checkers]
-            ordered = self._dep_graph.resolve_order(available_names)
-            # Only run checkers that are actually available
-            ordered = [n for n in ordered if n in self._checkers]
+            # Resolve execution levels via dependency graph, restricted to
+            # available checkers (unavailable deps are never expanded)
+            levels = self._dep_graph.resolve_levels(checker_names, available=self._available)
+            ordered = [n for level in levels for n in level]
 
             reports: Dict[str, dict] = {}
             total_pass = total_warn = total_fail = 0
             failing_checkers: List[str] = []
-            scan_start = time.time()
+            cache_hits: List[str] = []
+            # Config is part of every cache key — any config edit invalidates all entries
+            config_hash = hashlib.blake2b(
+                _dumps_sorted(self._config).encode("utf-8"), digest_size=8
+            ).hexdigest()
+            # Durations use the monotonic clock; wall clock is read once for scan_id
+            scan_start = time.perf_counter_ns()
             # GPT Review #4-6: monotonic scan_id for snapshot tracking
-            scan_id = f"scan_{int(scan_start * 1000)}"
-
-            for name in ordered:
-                checker = self._checkers[name]
-                t0 = time.time()
-                try:
-                    report = checker.run(self._project_root, self._config)
-                except Exception as e:
-                    logger.error(f"Checker {name} error: {e}")
-                    report = PhaseReport(name)
-                    report.add(CheckResult("error", CheckResult.FAIL, str(e)))
-                report.duration_ms = int((time.time() - t0) * 1000)
-
-                rd = report.to_dict()
-                rd["meta"] = checker.get_meta()
-                reports[name] = rd
-
-                total_pass += report.pass_count
-                total_warn += report.warn_count
-                total_fail += report.fail_count
-                if report.fail_count > 0:
-                    failing_checkers.append(name)
+            scan_id = f"scan_{time.time_ns() // 1_000_000}"
+
+            for level in levels:
+                # Checkers within a level are independent — run them concurrently
+                level_results = await asyncio.gather(
+                    *(asyncio.to_thread(self._run_one, name, config_hash) for name in level)
+                )
+                for name, (rd, cached) in zip(level, level_results):
+                    reports[name] = rd
+                    if cached:
+                        cache_hits.append(name)
+
+                    total_pass += rd["pass_count"]
+                    total_warn += rd["warn_count"]
+                    total_fail += rd["fail_count"]
+                    if rd["fail_count"] > 0:
+                        failing_checkers.append(name)
 
             total_active = total_pass + total_warn + total_fail
             health_pct = (total_pass / total_active * 100) if total_active else 100
@@ -139,24 +193,26 @@ class Executor:
                 "CRITICAL" if total_fail > 0
                 else ("DEGRADED" if total_warn > 0 else "HEALTHY")
             )
-            duration_ms = int((time.time() - scan_start) * 1000)
-
+            duration_ms = (time.perf_counter_ns() - scan_start) // 1_000_000
+
+            data: ScanCompletedData = {
+                "scan_id": scan_id,
+                "scan_timestamp": datetime.now().isoformat(),
+                "reports": reports,
+                "overall": overall,
+                "total_pass": total_pass,
+                "total_warn": total_warn,
+                "total_fail": total_fail,
+                "health_pct": round(health_pct, 1),
+                "has_critical": total_fail > 0,
+                "failing_checkers": failing_checkers,
+                "checker_names": ordered,
+                "cache_hits": cache_hits,
+                "duration_ms": duration_ms,
+            }
             return AgentEvent(
                 type=EventType.SCAN_COMPLETED,
-                data={
-                    "scan_id": scan_id,
-                    "scan_timestamp": datetime.now().isoformat(),
-                    "reports": reports,
-                    "overall": overall,
-                    "total_pass": total_pass,
-                    "total_warn": total_warn,
-                    "total_fail": total_fail,
-                    "health_pct": round(health_pct, 1),
-                    "has_critical": total_fail > 0,
-                    "failing_checkers": failing_checkers,
-                    "checker_names": ordered,
-                    "duration_ms": duration_ms,
-                },
+                data=data,
                 source="executor",
                 workspace_id=self._workspace_id,
             )
@@ -164,51 +220,139 @@ class Executor:
             self._executing = False
             self._execution_lock.release()
 
-    # GPT Review #5-6: key names that typically hold secrets
-    _SECRET_KEYS = re.compile(
-        r'(?i)'
-        r'(api[_-]?key|secret[_-]?key|token|password|passwd|auth[_-]?token'
-        r'|access[_-]?key|private[_-]?key|credentials?|secret)',
+    def _run_one(self, name: str, config_hash: str) -> Tuple[dict, bool]:
+        """Run a single checker (in a worker thread), timing it and wrapping errors.
+
+        Returns (report dict with meta, served_from_cache).
+        """
+        checker = self._checkers[name]
+
+        cache_key = None
+        try:
+            fp = checker.input_fingerprint(self._project_root, self._config)
+        except Exception as e:
+            logger.debug(f"Checker {name} fingerprint failed: {e}")
+            fp = None
+        if fp is not None:
+            cache_key = f"{config_hash}:{fp}"
+            entry = self._result_cache.get(name)
+            if entry and entry[0] == cache_key:
+                return dict(entry[1]), True
+
+        t0 = time.perf_counter_ns()
+        failed = False
+        try:
+            report = checker.run(self._project_root, self._config)
+        except Exception as e:
+            logger.error(f"Checker {name} error: {e}")
+            report = PhaseReport(name)
+            report.add(CheckResult("error", CheckResult.FAIL, str(e)))
+            failed = True
+        report.duration_ms = (time.perf_counter_ns() - t0) // 1_000_000
+
+        rd = report.to_dict()
+        rd["meta"] = checker.get_meta()
+        # Never cache a crashed run — the next scan should retry it
+        if cache_key is not None and not failed:
+            self._result_cache[name] = (cache_key, rd)
+        return rd, False
+
+    # GPT Review #5-6 + #6-6: both redaction layers in one alternation so the
+    # text is scanned once. Key names are case-insensitive; prefixes are not.
+    _SECRET_PATTERN = re.compile(
+        # Layer 1 (key-based): secret_key_name + separator(s) + value (8+ chars)
+        r'(?P<kv>(?i:api[_-]?key|secret[_-]?key|token|password|passwd|auth[_-]?token'
+        r'|access[_-]?key|private[_-]?key|credentials?|secret)'
+        r'(?:\\"|"|\'|=|:|\s)*)'   # key + separators (inc. escaped quotes)
+        r'[^\s",}{\\]{8,}'          # value: 8+ non-delimiter chars
+        # Layer 2 (prefix-based): well-known secret prefixes, no key needed
+        r'|sk-[a-zA-Z0-9_-]{20,}'          # OpenAI API keys (sk-proj-..., sk-...)
+        r'|AIza[a-zA-Z0-9_-]{30,}'         # Google API keys
+        r'|Bearer\s+[a-zA-Z0-9._-]{20,}'   # Bearer tokens
+        r'|ghp_[a-zA-Z0-9]{36,}'           # GitHub PAT
+        r'|gho_[a-zA-Z0-9]{36,}'           # GitHub OAuth
+        r'|xoxb-[a-zA-Z0-9-]{20,}'         # Slack bot tokens
+        r'|xoxp-[a-zA-Z0-9-]{20,}',        # Slack user tokens
     )
 
-    # GPT Review #6-6: well-known secret prefixes (value-based, no key needed)
-    _SECRET_PREFIX_PATTERN = re.compile(
-        r'(?:sk-[a-zA-Z0-9_-]{20,})'       # OpenAI API keys (sk-proj-..., sk-...)
-        r'|(?:AIza[a-zA-Z0-9_-]{30,})'     # Google API keys
-        r'|(?:Bearer\s+[a-zA-Z0-9._-]{20,})'  # Bearer tokens
-        r'|(?:ghp_[a-zA-Z0-9]{36,})'       # GitHub PAT
-        r'|(?:gho_[a-zA-Z0-9]{36,})'       # GitHub OAuth
-        r'|(?:xoxb-[a-zA-Z0-9-]{20,})'     # Slack bot tokens
-        r'|(?:xoxp-[a-zA-Z0-9-]{20,})',    # Slack user tokens
+    # Cheap prefilter: every _SECRET_PATTERN match contains one of these
+    # substrings. Most reports contain none, so the full regex is skipped.
+    _SECRET_HINT = re.compile(
+        r'key|token|passw|secret|credential|sk-|aiza|bearer|gh[po]_|xox[bp]-',
+        re.IGNORECASE,
     )
 
+    @staticmethod
+    def _redact_match(m: "re.Match") -> str:
+        # Key-based hit keeps the key + separators; prefix hit is replaced whole
+        kv = m.group("kv")
+        return f"{kv}[REDACTED]" if kv is not None else "[REDACTED]"
+
     @staticmethod
     def _redact_secrets(text: str) -> str:
         """GPT Review #5-6 + #6-6: redact secret-like values from text before hashing.
 
-        Two-layer strategy:
+        Two-layer strategy (single regex pass):
           Layer 1 (key-based): known key names (api_key, password, token...) → redact value
           Layer 2 (prefix-based): known secret prefixes (sk-, AIza, Bearer...) → redact anywhere
 
         Note on hash collision (GPT Review #6-6):
           Redaction makes different secrets produce the same hash. This is intentional—
-          the hash identifies *diagnostic state*, not *secret values*. The 16-char SHA-256
-          prefix has ~2^64 collision space, which is sufficient for identifying report snapshots.
+          the hash identifies *diagnostic state*, not *secret values*. The 16-char BLAKE2b-64
+          digest has ~2^64 collision space, which is sufficient for identifying report snapshots.
           This hash is NOT a security token.
         """
-        # Layer 1: key-based — secret_key_name + separator(s) + value (8+ chars)
-        result = re.sub(
-            r'(?i)'
-            r'((?:api[_-]?key|secret[_-]?key|token|password|passwd|auth[_-]?token'
-            r'|access[_-]?key|private[_-]?key|credentials?|secret)'
-            r'(?:\\"|"|\'|=|:|\s)*)'   # key + separators (inc. escaped quotes)
-            r'([^\s",}{\\]{8,})',       # value: 8+ non-delimiter chars
-            r'\1[REDACTED]',
-            text,
-        )
-        # Layer 2: prefix-based — catch secrets anywhere by known prefix patterns
-        result = Executor._SECRET_PREFIX_PATTERN.sub('[REDACTED]', result)
-        return result
+        if Executor._SECRET_HINT.search(text) is None:
+            return text
+        return Executor._SECRET_PATTERN.sub(Executor._redact_match, text)
+
+    @staticmethod
+    def _redact_prefix(buf: str, limit: int) -> Tuple[str, int]:
+        """Redact buf[:limit] for streaming; returns (redacted text, chars consumed).
+
+        A match that straddles `limit` is left for the next window (consumed
+        stops at its start), so windowed output equals _redact_secrets(whole).
+        """
+        out: List[str] = []
+        pos = 0
+        if Executor._SECRET_HINT.search(buf) is not None:
+            for m in Executor._SECRET_PATTERN.finditer(buf):
+                if m.end() > limit:
+                    limit = min(limit, m.start())
+                    break
+                out.append(buf[pos:m.start()])
+                out.append(Executor._redact_match(m))
+                pos = m.end()
+        out.append(buf[pos:limit])
+        return "".join(out), limit
+
+    _HASH_CACHE_SIZE = 32
+
+    def _report_hash(self, report: dict) -> str:
+        """_compute_report_hash memoized by report identity + timestamp.
+
+        Retrying LLM analysis on the same snapshot dict reuses the hash
+        instead of re-serializing the whole report.
+        """
+        key = id(report)
+        ts = report.get("timestamp")
+        entry = self._hash_cache.get(key)
+        if entry is not None and entry[0] is report and entry[1] == ts:
+            self._hash_cache.move_to_end(key)
+            return entry[2]
+        digest = self._compute_report_hash(report)
+        self._hash_cache[key] = (report, ts, digest)
+        if len(self._hash_cache) > self._HASH_CACHE_SIZE:
+            self._hash_cache.popitem(last=False)
+        return digest
+
+    # Reports up to _HASH_STREAM_THRESHOLD chars of JSON are redacted and hashed
+    # in one shot. Larger ones are redacted + hashed in ~64 KiB windows so the
+    # redacted text and its UTF-8 copy are never held whole; the last 256 chars
+    # carry over so secrets split across window boundaries are still seen whole.
+    _HASH_STREAM_THRESHOLD = 1 << 20
+    _HASH_WINDOW = 64 * 1024
+    _HASH_OVERLAP = 256
 
     @staticmethod
     def _compute_report_hash(report: dict) -> str:
@@ -216,17 +360,31 @@ class Executor:
 
         GPT Review #5-6: redacts secret-like values (API keys, tokens, passwords)
         before hashing to prevent sensitive data from leaking into hash inputs.
-        The hash itself is one-way, but the raw JSON input passed to json.dumps
+        The hash itself is one-way, but the raw JSON input passed to the serializer
         could theoretically be logged or inspected.
         """
         # Strip timing data that changes every run, keep only diagnostic content
         stripped = {k: v for k, v in report.items() if k not in ("duration_ms", "timestamp")}
-        raw = json.dumps(stripped, sort_keys=True, ensure_ascii=False, default=str)
-        # Redact secret-like patterns before hashing
-        raw = Executor._redact_secrets(raw)
-        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
-
-    def _execute_llm_analysis(
+        # BLAKE2b with an 8-byte digest yields the 16 hex chars directly (no truncation)
+        hasher = hashlib.blake2b(digest_size=8)
+        # One-shot serialization keeps the C encoder (orjson / stdlib)
+        raw = _dumps_sorted(stripped)
+        if len(raw) <= Executor._HASH_STREAM_THRESHOLD:
+            # Redact secret-like patterns before hashing
+            hasher.update(Executor._redact_secrets(raw).encode("utf-8"))
+            return hasher.hexdigest()
+
+        window = Executor._HASH_WINDOW
+        tail = ""
+        for start in range(0, len(raw), window):
+            buf = tail + raw[start:start + window]
+            text, used = Executor._redact_prefix(buf, len(buf) - Executor._HASH_OVERLAP)
+            hasher.update(text.encode("utf-8"))
+            tail = buf[used:]
+        hasher.update(Executor._redact_secrets(tail).encode("utf-8"))
+        return hasher.hexdigest()
+
+    async def _execute_llm_analysis(
         self, checker_name: str, report: Optional[dict] = None
     ) -> AgentEvent:
         """Tier 2: LLM deep analysis of a checker's results.
@@ -250,7 +408,9 @@ class Executor:
             checker = self._checkers.get(checker_name)
             if checker:
                 try:
-                    r = checker.run(self._project_root, self._config)
+                    r = await asyncio.to_thread(
+                        checker.run, self._project_root, self._config
+                    )
                     report = r.to_dict()
                     report_was_fresh = True
                 except Exception as e:
@@ -270,31 +430,48 @@ class Executor:
             )
 
         # GPT Review #4-6: snapshot context for traceability
-        report_hash = self._compute_report_hash(report)
+        report_hash = self._report_hash(report)
         analysis_ts = datetime.now().isoformat()
 
         try:
-            analysis = self._llm.analyze_report(checker_name, report, self._config)
+            # The worker thread can't be interrupted; on timeout it finishes in
+            # the background and its result is discarded.
+            analysis = await asyncio.wait_for(
+                asyncio.to_thread(
+                    self._llm.analyze_report, checker_name, report, self._config
+                ),
+                timeout=self._llm_timeout,
+            )
 
+            data: LLMAnalysisData = {
+                "checker": checker_name,
+                "analysis": analysis.analysis_text,
+                "root_causes": analysis.root_causes,
+                "fix_suggestions": analysis.fix_suggestions,
+                "model": analysis.model_used,
+                "cost_usd": analysis.cost_usd,
+                "tokens": {
+                    "prompt": analysis.prompt_tokens,
+                    "completion": analysis.completion_tokens,
+                },
+                "evidence": analysis.evidence_summary,
+                # GPT Review #4-6: snapshot tracking fields
+                "report_hash": report_hash,
+                "analysis_timestamp": analysis_ts,
+                "report_was_fresh": report_was_fresh,
+            }
             return AgentEvent(
                 type=EventType.LLM_ANALYSIS_COMPLETED,
-                data={
-                    "checker": checker_name,
-                    "analysis": analysis.analysis_text,
-                    "root_causes": analysis.root_causes,
-                    "fix_suggestions": analysis.fix_suggestions,
-                    "model": analysis.model_used,
-                    "cost_usd": analysis.cost_usd,
-                    "tokens": {
-                        "prompt": analysis.prompt_tokens,
-                        "completion": analysis.completion_tokens,
-                    },
-                    "evidence": analysis.evidence_summary,
-                    # GPT Review #4-6: snapshot tracking fields
-                    "report_hash": report_hash,
-                    "analysis_timestamp": analysis_ts,
-                    "report_was_fresh": report_was_fresh,
-                },
+                data=data,
+                source="executor",
+                workspace_id=self._workspace_id,
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"LLM analysis timed out after {self._llm_timeout}s: {checker_name}")
+            return AgentEvent(
+                type=EventType.LLM_ANALYSIS_COMPLETED,
+                data={"error": "timeout", "checker": checker_name,
+                      "timeout_seconds": self._llm_timeout},
                 source="executor",
                 workspace_id=self._workspace_id,
             )
@@ -1,9 +1,11 @@
 """CheckerDependencyGraph — topological sort for checker execution ordering.
 
 Resolves which checkers must run before others, and computes an execution
-order via Kahn's algorithm. Handles transitive dependencies automatically.
+order via Kahn's algorithm (reverse adjacency list + min-heap, O(V+E log V)).
+Handles transitive dependencies automatically.
 """
-from typing import Dict, List, Set
+import heapq
+from typing import AbstractSet, Dict, FrozenSet, List, Optional, Set, Tuple
 
 
 # Default dependency definitions.
@@ -35,18 +37,33 @@ DEFAULT_DEPENDENCIES: Dict[str, List[str]] = {
 }
 
 
+# Memo key for resolve_order / resolve_levels: (requested, available or None)
+_CacheKey = Tuple[FrozenSet[str], Optional[FrozenSet[str]]]
+
+
 class CheckerDependencyGraph:
     """Manages checker dependencies and computes execution order."""
 
     def __init__(self, dependencies: Dict[str, List[str]] = None):
         self._deps: Dict[str, Set[str]] = {}
+        # Reverse edges: dep → checkers that depend on it (kept in sync with _deps)
+        self._reverse_adj: Dict[str, Set[str]] = {}
+        # resolve_order memo — the graph rarely changes after construction and
+        # watcher-driven scans keep requesting the same checker sets
+        self._order_cache: Dict[_CacheKey, Tuple[str, ...]] = {}
+        self._levels_cache: Dict[_CacheKey, Tuple[Tuple[str, ...], ...]] = {}
         raw = dependencies or DEFAULT_DEPENDENCIES
         for checker, deps in raw.items():
             self._deps[checker] = set(deps)
+            for dep in deps:
+                self._reverse_adj.setdefault(dep, set()).add(checker)
 
     def add_dependency(self, checker: str, depends_on: str):
         """Add a single dependency edge."""
         self._deps.setdefault(checker, set()).add(depends_on)
+        self._reverse_adj.setdefault(depends_on, set()).add(checker)
+        self._order_cache.clear()
+        self._levels_cache.clear()
 
     def add_from_checker(self, checker_name: str, depends_on_list: List[str]):
         """Add dependencies declared by a BaseChecker.depends_on attribute."""
@@ -56,48 +73,116 @@ class CheckerDependencyGraph:
     def get_dependencies(self, checker: str) -> Set[str]:
         return self._deps.get(checker, set())
 
-    def resolve_order(self, checker_names: List[str]) -> List[str]:
+    def resolve_order(self, checker_names: List[str],
+                      available: Optional[AbstractSet[str]] = None) -> List[str]:
         """Topological sort of requested checkers, pulling in dependencies.
 
         If checker A depends on B, and only A is requested, B will be
-        included and run first (but only if B is in the available set).
+        included and run first (but only if B is in the `available` set).
+        When `available` is given, unavailable names are never expanded, so
+        the result contains only runnable checkers.
+        Results are memoized per checker set until the graph is mutated.
         """
-        # Expand: include all transitive dependencies
-        needed: Set[str] = set()
-        to_process = list(checker_names)
-        while to_process:
-            name = to_process.pop()
-            if name in needed:
-                continue
-            needed.add(name)
-            for dep in self._deps.get(name, set()):
-                if dep not in needed:
-                    to_process.append(dep)
+        key = self._cache_key(checker_names, available)
+        cached = self._order_cache.get(key)
+        if cached is not None:
+            return list(cached)
 
-        # Topological sort (Kahn's algorithm)
-        in_degree: Dict[str, int] = {n: 0 for n in needed}
-        for n in needed:
-            for dep in self._deps.get(n, set()):
-                if dep in needed:
-                    in_degree[n] = in_degree.get(n, 0) + 1
+        in_degree = self._expand(checker_names, available)
+        needed = in_degree.keys()
 
-        queue = sorted([n for n in needed if in_degree[n] == 0])
+        # Topological sort (Kahn's algorithm)
+        # Min-heap keeps the ready set in lexicographic order for determinism
+        queue = [n for n in needed if in_degree[n] == 0]
+        heapq.heapify(queue)
         result: List[str] = []
 
         while queue:
-            node = queue.pop(0)
+            node = heapq.heappop(queue)
             result.append(node)
-            for n in needed:
-                if node in self._deps.get(n, set()):
+            # Only visit true dependents instead of scanning every needed node
+            for n in self._reverse_adj.get(node, ()):
+                if n in needed:
                     in_degree[n] -= 1
                     if in_degree[n] == 0:
-                        # Insert in sorted position for determinism
-                        queue.append(n)
-                        queue.sort()
+                        heapq.heappush(queue, n)
 
         # Safety: add any remaining (handles cycles gracefully)
         remaining = needed - set(result)
         if remaining:
             result.extend(sorted(remaining))
 
+        self._order_cache[key] = tuple(result)
         return result
+
+    def resolve_levels(self, checker_names: List[str],
+                       available: Optional[AbstractSet[str]] = None) -> List[List[str]]:
+        """Topological layers of requested checkers (dependencies pulled in).
+
+        Level 0 holds every checker with no pending dependency; each following
+        level holds the checkers unblocked once all previous levels finished.
+        Checkers within a level are independent and may run concurrently.
+        Nodes caught in a cycle are appended as single-node levels (sequential).
+        `available` restricts expansion exactly as in resolve_order().
+        """
+        key = self._cache_key(checker_names, available)
+        cached = self._levels_cache.get(key)
+        if cached is not None:
+            return [list(level) for level in cached]
+
+        in_degree = self._expand(checker_names, available)
+        needed = in_degree.keys()
+
+        levels: List[List[str]] = []
+        current = sorted(n for n in needed if in_degree[n] == 0)
+        while current:
+            levels.append(current)
+            nxt: List[str] = []
+            for node in current:
+                for n in self._reverse_adj.get(node, ()):
+                    if n in needed:
+                        in_degree[n] -= 1
+                        if in_degree[n] == 0:
+                            nxt.append(n)
+            current = sorted(nxt)
+
+        # Safety: add any remaining (handles cycles gracefully)
+        placed = {n for level in levels for n in level}
+        levels.extend([n] for n in sorted(needed - placed))
+
+        self._levels_cache[key] = tuple(tuple(level) for level in levels)
+        return levels
+
+    @staticmethod
+    def _cache_key(checker_names: List[str],
+                   available: Optional[AbstractSet[str]]) -> _CacheKey:
+        # Callers should pass a frozenset for `available` — its hash is cached
+        if available is not None and not isinstance(available, frozenset):
+            available = frozenset(available)
+        return frozenset(checker_names), available
+
+    def _expand(self, checker_names: List[str],
+                available: Optional[AbstractSet[str]] = None) -> Dict[str, int]:
+        """Requested checkers plus all their transitive (available) dependencies.
+
+        Returns {checker: in-degree}, tallied during the same walk: every
+        available dependency of a needed checker is itself needed, so each
+        counted edge is guaranteed to stay inside the result.
+        """
+        in_degree: Dict[str, int] = {}
+        if available is None:
+            to_process = list(checker_names)
+        else:
+            to_process = [n for n in checker_names if n in available]
+        while to_process:
+            name = to_process.pop()
+            if name in in_degree:
+                continue
+            count = 0
+            for dep in self._deps.get(name, ()):
+                if available is None or dep in available:
+                    count += 1
+                    if dep not in in_degree:
+                        to_process.append(dep)
+            in_degree[name] = count
+        return in_degree
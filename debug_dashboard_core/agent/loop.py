@@ -1,21 +1,25 @@
 """AgentLoop — autonomous Observe → Reason → Act cycle.
 
 This is the heart of the agent system. It runs in a background daemon thread,
-processing events from a queue and cycling through the ORA loop.
+processing events from a queue and cycling through the ORA loop. The thread
+owns a private asyncio event loop that drives the (async) Executor.
 
 GPT Risk #1 addressed: singleton lock prevents duplicate agent instances.
 GPT Risk #2 addressed: workspace_id flows through all events.
 GPT Risk #4 addressed: retention purge on startup.
 """
+import asyncio
 import threading
 import time
 import queue
 import logging
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from . import AgentState
+from .bus import NotifiableDeque
 from .events import AgentEvent, EventType
 from .observer import FileObserver
 from .reasoner import Reasoner
@@ -26,6 +30,50 @@ from .. import storage
 
 logger = logging.getLogger("agent.loop")
 
+# (old, new) → AGENT_STATE_CHANGED payload. Payloads are never mutated after
+# emit, so every occurrence of a transition shares one dict.
+_STATE_CHANGE_DATA: Dict[Tuple[AgentState, AgentState], dict] = {}
+
+# Shared read-only fallback for missing nested dicts (never mutated)
+_EMPTY: dict = {}
+
+# Per-client SSE queue bound; also the largest slice fanned out at once
+_SSE_CLIENT_QUEUE_SIZE = 200
+
+
+def _merge_file_changes(events: List[AgentEvent]) -> List[AgentEvent]:
+    """Fold every FILE_CHANGED in `events` into one, placed where the first was.
+
+    Other events keep their relative order. The merged event carries all
+    changed files and the union of affected checkers, so the Reasoner plans
+    a single scan for the whole backlog.
+    """
+    file_events = [e for e in events if e.type == EventType.FILE_CHANGED]
+    if len(file_events) < 2:
+        return events
+    first = file_events[0]
+    files: list = []
+    affected = set()
+    file_count = 0
+    for e in file_events:
+        files.extend(e.data.get("files", ()))
+        affected.update(e.data.get("affected_checkers", ()))
+        file_count += e.data.get("file_count", 0)
+    merged = AgentEvent(
+        type=EventType.FILE_CHANGED,
+        timestamp=first.timestamp,
+        data={"files": files, "affected_checkers": sorted(affected), "file_count": file_count},
+        source=first.source,
+        workspace_id=first.workspace_id,
+    )
+    out: List[AgentEvent] = []
+    for e in events:
+        if e.type != EventType.FILE_CHANGED:
+            out.append(e)
+        elif e is first:
+            out.append(merged)
+    return out
+
 
 class AgentLoop:
     """Main agent loop. Runs in a background daemon thread.
@@ -63,39 +111,67 @@ class AgentLoop:
         self.executor = executor
         self.observer = observer
         self.on_event = on_event or (lambda e: None)
+        # Workspace config is fixed for the loop's lifetime — fold it once
+        self._scan_project_name = (
+            f"{config.get('project', {}).get('name', 'Unknown')} [{workspace_id}]"
+        )
 
         self._state = AgentState.IDLE
-        self._event_queue: queue.Queue[AgentEvent] = queue.Queue()
+        self._wired_state = AgentState.IDLE   # last state announced via AGENT_STATE_CHANGED
+        # Single consumer (this loop's thread) — deque bus, no Queue mutex per hop
+        self._event_queue = NotifiableDeque()
         self._thread: Optional[threading.Thread] = None
+        self._aio_loop: Optional[asyncio.AbstractEventLoop] = None
         self._stop_event = threading.Event()
         # GPT Review #4-1: pass configurable TTL to singleton lock
         singleton_ttl = config.get("agent", {}).get("singleton_max_age_seconds", 86400)
         self._singleton_lock = AgentSingletonLock(workspace_id, max_age_seconds=singleton_ttl)
 
         # GPT Review #3E: runtime purge tracking
-        self._last_purge_time: float = 0
-        self._purge_interval_seconds: float = config.get(
+        # Monotonic clock: immune to wall-clock jumps (NTP, DST, manual changes)
+        self._last_purge_ns: int = 0
+        self._purge_interval_ns: int = int(config.get(
             "agent", {}
-        ).get("purge_interval_seconds", 3600)  # default: 1 hour
+        ).get("purge_interval_seconds", 3600) * 1_000_000_000)  # default: 1 hour
 
         # Wire observer's output into our event queue
         self.observer.set_event_sink(self._event_queue)
 
-        # SSE client queues — for real-time browser updates
-        self._sse_clients: List[queue.Queue] = []
+        # SSE client queues — for real-time browser updates. _emit only appends
+        # to the outbox; a dispatcher thread (started with the first client)
+        # fans batches out to the clients, off the reasoning/execution path.
+        self._sse_clients: Dict[int, NotifiableDeque] = {}   # id(queue) → queue
         self._sse_lock = threading.Lock()
+        self._sse_outbox = NotifiableDeque()
+        self._sse_dispatcher: Optional[threading.Thread] = None
+        self._sse_seq = 0   # sequence number of the next event fanned out
 
     @property
     def state(self) -> AgentState:
         return self._state
 
-    def _set_state(self, new_state: AgentState):
-        old = self._state
+    def _set_state(self, new_state: AgentState, wire: bool = True):
+        """Update the state; announce it only if it differs from the last announced one.
+
+        wire=False is for sub-millisecond transient states (REASONING): the state
+        is visible via get_status() but not emitted, so e.g. OBSERVING →
+        REASONING → OBSERVING produces no events and OBSERVING → REASONING →
+        EXECUTING produces a single observing→executing event.
+        """
         self._state = new_state
+        if not wire:
+            return
+        old = self._wired_state
         if old != new_state:
+            self._wired_state = new_state
+            data = _STATE_CHANGE_DATA.get((old, new_state))
+            if data is None:
+                data = _STATE_CHANGE_DATA.setdefault(
+                    (old, new_state), {"old": old.value, "new": new_state.value}
+                )
             self._emit(AgentEvent(
                 type=EventType.AGENT_STATE_CHANGED,
-                data={"old": old.value, "new": new_state.value},
+                data=data,
                 source="loop",
                 workspace_id=self.workspace_id,
             ))
@@ -104,29 +180,79 @@ class AgentLoop:
         """Emit event to memory + external listeners (SSE clients)."""
         self.memory.record_event(event)
         self.on_event(event)
-        # Push to all SSE clients
-        with self._sse_lock:
-            dead: List[queue.Queue] = []
-            for client_q in self._sse_clients:
-                try:
-                    client_q.put_nowait(event)
-                except queue.Full:
-                    dead.append(client_q)
-            for d in dead:
-                self._sse_clients.remove(d)
-
-    def register_sse_client(self) -> queue.Queue:
-        """Register a new SSE client and return its event queue."""
-        client_q: queue.Queue = queue.Queue(maxsize=200)
-        with self._sse_lock:
-            self._sse_clients.append(client_q)
-        return client_q
+        # Hand off to the SSE dispatcher (no per-client work on this thread).
+        # Lock-free emptiness check: headless runs (no browser) skip SSE
+        # entirely; a client registering concurrently only misses this event.
+        if self._sse_clients:
+            self._sse_outbox.put(event)
+
+    def _sse_dispatch(self):
+        """SSE dispatcher thread: drain the outbox and fan each batch out.
+
+        Client queues are bounded, so a lagging client drops its oldest
+        events instead of ever blocking the dispatcher. Queue items are
+        (seq, event) with consecutive sequence numbers, so the SSE stream can
+        tell the browser exactly how many events it skipped.
+        """
+        outbox = self._sse_outbox
+        try:
+            while True:
+                batch = [outbox.get()]
+                batch.extend(outbox.drain())
+                if not self._sse_clients:
+                    continue  # last client left while these were queued
+                # Encode each event for the wire once here, not once per client.
+                # An unencodable payload is dropped, never allowed to kill the thread.
+                ready: List[AgentEvent] = []
+                for event in batch:
+                    try:
+                        event.wire_bytes()
+                    except Exception as e:
+                        logger.warning(f"Dropping unencodable SSE event ({event.type}): {e}")
+                        continue
+                    ready.append(event)
+                if not ready:
+                    continue
+                # An oversized batch goes out in queue-sized slices, yielding
+                # between them so client streams can drain
+                for i in range(0, len(ready), _SSE_CLIENT_QUEUE_SIZE):
+                    if i:
+                        time.sleep(0)
+                    with self._sse_lock:
+                        seq = self._sse_seq
+                        tagged = list(enumerate(ready[i:i + _SSE_CLIENT_QUEUE_SIZE], seq))
+                        self._sse_seq = seq + len(tagged)
+                        for client_q in self._sse_clients.values():
+                            client_q.put_many(tagged)
+        except Exception as e:
+            logger.exception(f"SSE dispatcher error: {e}")
+        finally:
+            # Let the next register_sse_client() start a fresh dispatcher
+            with self._sse_lock:
+                self._sse_dispatcher = None
+
+    def register_sse_client(self) -> Tuple[NotifiableDeque, int]:
+        """Register a new SSE client.
 
-    def unregister_sse_client(self, client_q: queue.Queue):
+        Returns its (seq, event) queue and the sequence number its first
+        event will carry.
+        """
+        client_q = NotifiableDeque(maxlen=_SSE_CLIENT_QUEUE_SIZE)
+        with self._sse_lock:
+            self._sse_clients[id(client_q)] = client_q
+            first_seq = self._sse_seq
+            if self._sse_dispatcher is None:
+                self._sse_dispatcher = threading.Thread(
+                    target=self._sse_dispatch, daemon=True,
+                    name=f"agent-sse-{self.workspace_id[:6]}",
+                )
+                self._sse_dispatcher.start()
+        return client_q, first_seq
+
+    def unregister_sse_client(self, client_q: NotifiableDeque):
         """Unregister an SSE client."""
         with self._sse_lock:
-            if client_q in self._sse_clients:
-                self._sse_clients.remove(client_q)
+            self._sse_clients.pop(id(client_q), None)
 
     def start(self) -> bool:
         """Start the agent loop. Returns False if already running or lock fails."""
@@ -167,6 +293,7 @@ class AgentLoop:
             self._thread.join(timeout=5)
         self._singleton_lock.release()
         self._set_state(AgentState.IDLE)
+        self.memory.flush()
         logger.info("Agent loop stopped")
 
     def request_scan(self, checker_names: List[str] = None):
@@ -191,10 +318,10 @@ class AgentLoop:
         """GPT Review #3E: periodic purge during long-running sessions.
         GPT Review #6 UI: emits purge event if data was actually deleted.
         """
-        now = time.time()
-        if now - self._last_purge_time < self._purge_interval_seconds:
+        now = time.monotonic_ns()
+        if now - self._last_purge_ns < self._purge_interval_ns:
             return
-        self._last_purge_time = now
+        self._last_purge_ns = now
         try:
             retention = self.config.get("agent", {}).get("retention", {})
             result = storage.purge_old_agent_data(
@@ -216,16 +343,40 @@ class AgentLoop:
             logger.warning(f"Runtime purge failed: {e}")
 
     def _run(self):
+        """Thread entry point: own an asyncio event loop for the Executor."""
+        self._aio_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._aio_loop)
+        try:
+            self._run_events()
+        finally:
+            self._aio_loop.close()
+            self._aio_loop = None
+
+    def _run_events(self):
         """Main loop: wait for events, reason, execute."""
         self._set_state(AgentState.OBSERVING)
-        self._last_purge_time = time.time()  # Reset on start
+        self._last_purge_ns = time.monotonic_ns()  # Reset on start
+        pending: "deque[AgentEvent]" = deque()  # drained from the queue, not yet handled
         while not self._stop_event.is_set():
-            try:
-                event = self._event_queue.get(timeout=1.0)
-            except queue.Empty:
-                # GPT Review #3E: check for periodic purge during idle
-                self._maybe_runtime_purge()
-                continue
+            if pending:
+                event = pending.popleft()
+            else:
+                try:
+                    event = self._event_queue.get(timeout=1.0)
+                except queue.Empty:
+                    # GPT Review #3E: check for periodic purge during idle
+                    self._maybe_runtime_purge()
+                    continue
+
+            # File-change batches that piled up while the last action ran are
+            # folded into this one, so a burst triggers one scan, not several
+            if event.type == EventType.FILE_CHANGED:
+                queued = self._event_queue.drain()
+                if queued:
+                    pending.extend(queued)
+                    events = _merge_file_changes([event, *pending])
+                    event = events[0]
+                    pending = deque(events[1:])
 
             try:
                 # OBSERVE: event received
@@ -233,7 +384,7 @@ class AgentLoop:
                 self._emit(event)
 
                 # REASON: decide what to do
-                self._set_state(AgentState.REASONING)
+                self._set_state(AgentState.REASONING, wire=False)
                 actions = self.reasoner.evaluate(event, self.memory)
 
                 # ACT: execute actions
@@ -243,7 +394,9 @@ class AgentLoop:
                         if action.action_type == "llm_analyze":
                             self._set_state(AgentState.WAITING_LLM)
 
-                        result_event = self.executor.execute(action)
+                        result_event = self._aio_loop.run_until_complete(
+                            self.executor.execute(action)
+                        )
                         self._emit(result_event)
 
                         # Record scan reports for memory (regression detection)
@@ -258,7 +411,7 @@ class AgentLoop:
                             try:
                                 data = result_event.data
                                 storage.save_scan(
-                                    project_name=f"{self.config.get('project', {}).get('name', 'Unknown')} [{self.workspace_id}]",
+                                    project_name=self._scan_project_name,
                                     overall_status=data.get("overall", "UNKNOWN"),
                                     total_pass=data.get("total_pass", 0),
                                     total_warn=data.get("total_warn", 0),
@@ -275,11 +428,12 @@ class AgentLoop:
                                 and not result_event.data.get("error")):
                             try:
                                 d = result_event.data
+                                tokens = d.get("tokens") or _EMPTY
                                 storage.save_llm_analysis(
                                     checker_name=d.get("checker", ""),
                                     model=d.get("model", ""),
-                                    prompt_tokens=d.get("tokens", {}).get("prompt", 0),
-                                    completion_tokens=d.get("tokens", {}).get("completion", 0),
+                                    prompt_tokens=tokens.get("prompt", 0),
+                                    completion_tokens=tokens.get("completion", 0),
                                     cost_usd=d.get("cost_usd", 0),
                                     analysis=d.get("analysis", ""),
                                     root_causes=d.get("root_causes", []),
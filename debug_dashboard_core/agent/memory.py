@@ -2,13 +2,18 @@
 
 Tracks: recent events, scan reports, LLM analyses, insights.
 Uses the same SQLite DB as storage.py (extended tables).
+Event rows are written in batches by a background writer thread.
 """
-import json
+import atexit
+import threading
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Tuple
 
 from .. import storage
-from .events import AgentEvent
+from .bus import NotifiableDeque
+from .events import AgentEvent, EventType
 
 
 class AgentMemory:
@@ -20,33 +25,69 @@ class AgentMemory:
 
     def __init__(self, workspace_id: str = "", max_memory_events: int = 500):
         self._workspace_id = workspace_id
-        self._recent_events: List[dict] = []
+        # Ring buffer: appends past max_memory_events evict the oldest in O(1)
+        self._recent_events: Deque[dict] = deque(maxlen=max_memory_events)
         self._max = max_memory_events
+        # Per-type index of _recent_events for hot lookups: (seq, entry) pairs,
+        # seq being the entry's position in the overall event stream
+        self._event_seq = 0
+        self._file_changes: Deque[Tuple[int, dict]] = deque(maxlen=max_memory_events)
         self._last_scan_time: Optional[datetime] = None
         self._scan_reports: List[Dict] = []  # last N scan report snapshots
+        # SQLite persistence is batched off the agent loop's thread: rows are
+        # queued here and written by _persist_loop (started on first event)
+        self._persist_queue = NotifiableDeque()
+        self._persist_lock = threading.Lock()   # keeps batches in queue order
+        self._persist_thread: Optional[threading.Thread] = None
 
     def record_event(self, event: AgentEvent):
         """Record event to in-memory buffer and SQLite."""
         entry = {
             "type": event.type.value,
-            "timestamp": event.timestamp.isoformat(),
+            "timestamp": event.timestamp_iso(),
             "source": event.source,
             "data": event.data,
         }
         self._recent_events.append(entry)
-        if len(self._recent_events) > self._max:
-            self._recent_events = self._recent_events[-self._max:]
+        self._event_seq += 1
+        if event.type is EventType.FILE_CHANGED:
+            self._file_changes.append((self._event_seq, entry))
 
-        # Persist to SQLite
+        # Persist to SQLite (queued; the writer thread commits in batches)
         try:
-            storage.save_agent_event(
-                event_type=event.type.value,
-                source=event.source,
-                data_json=json.dumps(event.data, ensure_ascii=False, default=str),
-                workspace_id=self._workspace_id,
-            )
+            self._persist_queue.put((
+                entry["timestamp"],
+                entry["type"],
+                event.source,
+                event.data_json(),
+                self._workspace_id,
+            ))
         except Exception:
-            pass  # Non-critical: don't break agent loop on storage error
+            return  # Non-critical: don't break agent loop on serialization error
+        if self._persist_thread is None:
+            self._persist_thread = threading.Thread(
+                target=self._persist_loop, daemon=True, name="agent-memory-writer"
+            )
+            self._persist_thread.start()
+            # The writer is a daemon thread — flush what's left at interpreter exit
+            atexit.register(self.flush)
+
+    def _persist_loop(self):
+        """Writer thread: commit everything queued so far as one transaction."""
+        while True:
+            self._persist_queue.wait()
+            self.flush()
+
+    def flush(self):
+        """Write all queued events now (also called on agent shutdown)."""
+        with self._persist_lock:
+            rows = self._persist_queue.drain()
+            if not rows:
+                return
+            try:
+                storage.save_agent_events(rows)
+            except Exception:
+                pass  # Non-critical: don't break agent loop on storage error
 
     def record_scan_reports(self, reports: Dict[str, dict]):
         """Record a scan result snapshot for diff/regression analysis."""
@@ -62,16 +103,21 @@ class AgentMemory:
         return self._scan_reports[:limit]
 
     def get_recent_events(self, limit: int = 50) -> List[dict]:
-        return self._recent_events[-limit:]
+        events = self._recent_events
+        return list(islice(events, max(len(events) - limit, 0), None))
 
     def get_recent_file_changes(self, limit: int = 20) -> List[dict]:
-        """Get recent file change events (for LLM evidence context)."""
+        """Get recent file change events (for LLM evidence context).
+
+        O(limit) via the file-change index; entries already evicted from
+        _recent_events (seq outside the last max_memory_events) are excluded.
+        """
+        oldest_seq = self._event_seq - len(self._recent_events)
         changes = []
-        for e in reversed(self._recent_events):
-            if e.get("type") == "file_changed":
-                changes.append(e)
-                if len(changes) >= limit:
-                    break
+        for seq, e in reversed(self._file_changes):
+            if seq <= oldest_seq or len(changes) >= limit:
+                break
+            changes.append(e)
         return changes
 
     def get_context_for_llm(self, checker_name: str) -> dict:
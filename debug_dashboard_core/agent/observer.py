@@ -3,60 +3,74 @@
 GPT Risk #3 addressed: 2-stage mapping (extension + path heuristic).
 Debounce prevents event flooding. IGNORE_DIRS filters noise.
 """
-import queue
+import os
 import time
 import threading
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Optional, Set, Tuple
 
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
 
+from .bus import NotifiableDeque
 from .events import AgentEvent, EventType, FileChangeEvent
 
 logger = logging.getLogger("agent.observer")
 
 # ── Stage 1: Extension → Checker mapping ──
-EXTENSION_CHECKER_MAP: Dict[str, List[str]] = {
-    ".py": ["code_quality", "security", "performance", "api_health", "dependency"],
-    ".sql": ["database", "schema_migration"],
-    ".db": ["database", "schema_migration"],
-    ".sqlite": ["database", "schema_migration"],
-    ".yaml": ["config_drift", "environment"],
-    ".yml": ["config_drift"],
-    ".env": ["environment", "security"],
-    ".txt": ["dependency"],           # requirements.txt
-    ".toml": ["dependency"],          # pyproject.toml
-    ".cfg": ["dependency"],           # setup.cfg
-    ".md": ["skill_template"],
-    ".json": ["config_drift"],
-    ".html": ["code_quality"],
-    ".js": ["code_quality"],
-    ".css": ["code_quality"],
+# Tuple values: immutable, smaller than lists. Checker names are identifier-like
+# literals, so CPython already interns them (no sys.intern needed).
+EXTENSION_CHECKER_MAP: Dict[str, Tuple[str, ...]] = {
+    ".py": ("code_quality", "security", "performance", "api_health", "dependency"),
+    ".sql": ("database", "schema_migration"),
+    ".db": ("database", "schema_migration"),
+    ".sqlite": ("database", "schema_migration"),
+    ".yaml": ("config_drift", "environment"),
+    ".yml": ("config_drift",),
+    ".env": ("environment", "security"),
+    ".txt": ("dependency",),           # requirements.txt
+    ".toml": ("dependency",),          # pyproject.toml
+    ".cfg": ("dependency",),           # setup.cfg
+    ".md": ("skill_template",),
+    ".json": ("config_drift",),
+    ".html": ("code_quality",),
+    ".js": ("code_quality",),
+    ".css": ("code_quality",),
 }
 
 # ── Stage 2: Path keyword → Checker refinement ──
-PATH_KEYWORD_MAP: Dict[str, List[str]] = {
-    "test": ["test_coverage"],
-    "tests": ["test_coverage"],
-    "migration": ["schema_migration"],
-    "migrations": ["schema_migration"],
-    "alembic": ["schema_migration"],
-    "skills": ["skill_template"],
-    "rag": ["rag_pipeline"],
-    "agent": ["agent_budget"],
-    "whisper": ["whisper_health"],
-    "ytdlp": ["ytdlp_pipeline"],
-    "yt_dlp": ["ytdlp_pipeline"],
-    "ontology": ["ontology_sync"],
-    "knowledge": ["knowledge_graph"],
-    "golden": ["golden_quality"],
-    "citation": ["citation_integrity"],
-    "search": ["search_index"],
-    "url": ["url_pattern"],
+PATH_KEYWORD_MAP: Dict[str, Tuple[str, ...]] = {
+    "test": ("test_coverage",),
+    "tests": ("test_coverage",),
+    "migration": ("schema_migration",),
+    "migrations": ("schema_migration",),
+    "alembic": ("schema_migration",),
+    "skills": ("skill_template",),
+    "rag": ("rag_pipeline",),
+    "agent": ("agent_budget",),
+    "whisper": ("whisper_health",),
+    "ytdlp": ("ytdlp_pipeline",),
+    "yt_dlp": ("ytdlp_pipeline",),
+    "ontology": ("ontology_sync",),
+    "knowledge": ("knowledge_graph",),
+    "golden": ("golden_quality",),
+    "citation": ("citation_integrity",),
+    "search": ("search_index",),
+    "url": ("url_pattern",),
 }
 
+# Keyword scan table compiled from PATH_KEYWORD_MAP: a keyword that contains
+# another keyword mapping to a superset of its checkers ("tests" ⊃ "test",
+# "migrations" ⊃ "migration") can never add anything, so it is not searched.
+_KEYWORD_SCAN: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+    (kw, checkers) for kw, checkers in PATH_KEYWORD_MAP.items()
+    if not any(
+        other != kw and other in kw and set(checkers) <= set(other_checkers)
+        for other, other_checkers in PATH_KEYWORD_MAP.items()
+    )
+)
+
 # Directories to always ignore
 IGNORE_DIRS: Set[str] = {
     ".git", "__pycache__", ".venv", "venv", "env",
@@ -73,6 +87,23 @@ IGNORE_FILES: Set[str] = {
     ".DS_Store", "Thumbs.db", ".gitkeep",
 }
 
+# Hidden files that are still relevant (everything else starting with "." is ignored)
+_VISIBLE_DOTFILES = frozenset({".env", ".gitignore", ".flake8"})
+
+# watchdog event_type → FileChangeEvent.change_type
+_CHANGE_TYPES: Dict[str, str] = {
+    "created": "created",
+    "modified": "modified",
+    "deleted": "deleted",
+    "moved": "modified",
+}
+
+
+def _suffix(name: str) -> str:
+    """Path(name).suffix on a bare file name, without building a Path."""
+    dot = name.rfind(".")
+    return name[dot:] if 0 < dot < len(name) - 1 else ""
+
 # GPT Review #3B: extensions that cause self-trigger loops
 # Agent writes .db (storage), .lock (singleton), .log files — must never re-trigger
 SELF_TRIGGER_EXTENSIONS: Set[str] = {
@@ -92,9 +123,14 @@ class _DebouncedHandler(FileSystemEventHandler):
         self._pending: Dict[str, FileChangeEvent] = {}
         self._lock = threading.Lock()
         self._debounce = debounce_seconds
-        self._sink: Optional[queue.Queue] = None
-        self._timer: Optional[threading.Timer] = None
+        self._sink: Optional[NotifiableDeque] = None
+        # One long-lived flush thread (started on the first event) instead of a
+        # new threading.Timer per fs event
+        self._last_event = 0.0
+        self._wake = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
         self._project_root: Path = Path(".")
+        self._root_prefix = "." + os.sep
 
         # GPT Review #4-2: merge user config ignore patterns with builtins
         # GPT Review #5-2: merge policy is ADD-ONLY. Config patterns are unioned
@@ -114,28 +150,38 @@ class _DebouncedHandler(FileSystemEventHandler):
                 self._ignore_extensions.add(ext)
             else:
                 self._ignore_extensions.add(f".{ext}")
+        # Frozen after merging — only ever read on the event hot path
+        self._ignore_dirs = frozenset(self._ignore_dirs)
+        self._ignore_extensions = frozenset(self._ignore_extensions)
 
-    def configure(self, project_root: Path, sink: queue.Queue):
+    def configure(self, project_root: Path, sink: NotifiableDeque):
         self._project_root = project_root
         self._sink = sink
+        # String prefix for the relative-path fast path in on_any_event
+        root = str(project_root)
+        self._root_prefix = root if root.endswith(os.sep) else root + os.sep
 
     def _should_ignore(self, path: str) -> bool:
-        p = Path(path)
+        # Plain string ops instead of Path(): this runs for every raw fs event
+        if os.altsep:
+            path = path.replace(os.altsep, os.sep)
+        parts = path.split(os.sep)
+        name = parts[-1]
         # Ignore specific files
-        if p.name in IGNORE_FILES:
+        if name in IGNORE_FILES:
             return True
         # Ignore hidden files (except .env, .gitignore)
-        if p.name.startswith(".") and p.name not in (".env", ".gitignore", ".flake8"):
+        if name.startswith(".") and name not in _VISIBLE_DOTFILES:
             return True
         # Ignore certain directories (builtins + user config)
-        for part in p.parts:
-            if part in self._ignore_dirs:
-                return True
+        if not self._ignore_dirs.isdisjoint(parts):
+            return True
+        suffix = _suffix(name)
         # GPT Review #3B: ignore self-trigger extensions (builtins + user config)
-        if p.suffix in self._ignore_extensions:
+        if suffix in self._ignore_extensions:
             return True
         # Ignore non-mapped extensions (unless no extension = possibly relevant)
-        if p.suffix and p.suffix not in EXTENSION_CHECKER_MAP:
+        if suffix and suffix not in EXTENSION_CHECKER_MAP:
             return True
         return False
 
@@ -146,35 +192,50 @@ class _DebouncedHandler(FileSystemEventHandler):
         if self._should_ignore(path):
             return
 
-        change_type_map = {
-            "created": "created",
-            "modified": "modified",
-            "deleted": "deleted",
-            "moved": "modified",
-        }
-        change_type = change_type_map.get(event.event_type, "modified")
+        change_type = _CHANGE_TYPES.get(event.event_type, "modified")
 
-        try:
-            rel = str(Path(path).relative_to(self._project_root))
-        except ValueError:
-            rel = path
+        # Raw string ops on the hot path; pathlib only for paths that don't
+        # start with the plain root prefix (unnormalized or outside the root)
+        if path.startswith(self._root_prefix):
+            rel = path[len(self._root_prefix):]
+        else:
+            try:
+                rel = str(Path(path).relative_to(self._project_root))
+            except ValueError:
+                rel = path
 
         fce = FileChangeEvent(
             path=path,
             change_type=change_type,
-            extension=Path(path).suffix,
+            extension=_suffix(os.path.basename(path)),
             relative_to_root=rel,
         )
 
         with self._lock:
             self._pending[path] = fce
-
-        # Reset debounce timer
-        if self._timer:
-            self._timer.cancel()
-        self._timer = threading.Timer(self._debounce, self._flush)
-        self._timer.daemon = True
-        self._timer.start()
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, daemon=True, name="observer-flush"
+                )
+                self._flusher.start()
+
+        # Push the debounce deadline; only wake the flusher if it is idle
+        self._last_event = time.monotonic()
+        if not self._wake.is_set():
+            self._wake.set()
+
+    def _flush_loop(self):
+        """Flush thread: once woken, flush after `debounce` seconds of quiet."""
+        while True:
+            self._wake.wait()
+            while True:
+                delay = self._last_event + self._debounce - time.monotonic()
+                if delay <= 0:
+                    break
+                time.sleep(delay)
+            # Clear before flushing: events recorded after this re-arm the wake
+            self._wake.clear()
+            self._flush()
 
     def _flush(self):
         with self._lock:
@@ -185,18 +246,21 @@ class _DebouncedHandler(FileSystemEventHandler):
 
         # ── 2-stage mapping (GPT Risk #3) ──
 
-        # Stage 1: Extension-based
+        # Stage 1: Extension-based (each distinct extension looked up once)
         affected_checkers: Set[str] = set()
-        for fce in batch:
-            checkers = EXTENSION_CHECKER_MAP.get(fce.extension, [])
-            affected_checkers.update(checkers)
+        for ext in {fce.extension for fce in batch}:
+            affected_checkers.update(EXTENSION_CHECKER_MAP.get(ext, ()))
+
+        # Stage 2: Path-keyword refinement. All paths are joined into one
+        # newline-separated string (no keyword contains "\n", so matches can't
+        # span two paths): one C-level substring search per keyword instead
+        # of files × keywords Python-level checks.
+        all_paths = "\n".join(fce.relative_to_root for fce in batch).lower()
+        for keyword, checkers in _KEYWORD_SCAN:
+            if keyword in all_paths:
+                affected_checkers.update(checkers)
 
-        # Stage 2: Path-keyword refinement
-        for fce in batch:
-            path_lower = fce.relative_to_root.lower()
-            for keyword, checkers in PATH_KEYWORD_MAP.items():
-                if keyword in path_lower:
-                    affected_checkers.update(checkers)
+        affected = sorted(affected_checkers)
 
         # Emit a single batched event
         self._sink.put(AgentEvent(
@@ -206,14 +270,14 @@ class _DebouncedHandler(FileSystemEventHandler):
                     {"path": f.relative_to_root, "change": f.change_type, "ext": f.extension}
                     for f in batch
                 ],
-                "affected_checkers": sorted(affected_checkers),
+                "affected_checkers": affected,
                 "file_count": len(batch),
             },
             source="watcher",
         ))
         logger.info(
             f"File change batch: {len(batch)} files → "
-            f"checkers: {sorted(affected_checkers)}"
+            f"checkers: {affected}"
         )
 
 
@@ -231,7 +295,7 @@ class FileObserver:
         self._observer: Optional[Observer] = None
         self._running = False
 
-    def set_event_sink(self, sink: queue.Queue):
+    def set_event_sink(self, sink: NotifiableDeque):
         self._handler.configure(self._project_root, sink)
 
     def start(self):
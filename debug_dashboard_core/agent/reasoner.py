@@ -9,7 +9,7 @@ GPT Risk #6 addressed: scan-in-progress guard.
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import List, Optional, Set
+from typing import Callable, Dict, List, Optional, Set
 
 from .events import AgentEvent, EventType
 from .memory import AgentMemory
@@ -17,9 +17,9 @@ from .memory import AgentMemory
 logger = logging.getLogger("agent.reasoner")
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
-    """An action the executor should perform."""
+    """An action the executor should perform (slotted: one or more per event)."""
     action_type: str        # "run_checkers", "llm_analyze", "emit_insights"
     checker_names: List[str] = field(default_factory=list)
     data: dict = field(default_factory=dict)
@@ -35,6 +35,10 @@ class Reasoner:
     def __init__(self, config: dict, checker_names: List[str]):
         self._config = config
         self._checker_names = set(checker_names)
+        # Fixed for the reasoner's lifetime. The sorted list is handed out as
+        # Action.checker_names for every full scan — consumers must not mutate it.
+        self._checker_names_sorted = sorted(self._checker_names)
+        self._full_scan_threshold = len(self._checker_names) * 0.6
         agent_cfg = config.get("agent", {})
         self._cooldown_seconds = agent_cfg.get("scan_cooldown_seconds", 30)
         self._auto_scan = agent_cfg.get("auto_scan_on_change", True)
@@ -43,60 +47,70 @@ class Reasoner:
         # minimum interval to prevent button-mashing / script abuse
         self._manual_min_interval = agent_cfg.get("manual_scan_min_interval", 2)
         self._last_manual_scan: Optional[datetime] = None
+        # event type → handler(event, memory) -> List[Action]
+        self._dispatch: Dict[EventType, Callable[[AgentEvent, AgentMemory], List[Action]]] = {
+            EventType.FILE_CHANGED: self._handle_file_change,
+            EventType.SCAN_REQUESTED: self._handle_scan_requested,
+            EventType.LLM_ANALYSIS_REQUESTED: self._handle_llm_request,
+            EventType.SCAN_COMPLETED: self._handle_scan_completed,
+        }
 
     def evaluate(self, event: AgentEvent, memory: AgentMemory) -> List[Action]:
         """Evaluate an event and return a list of actions."""
+        handler = self._dispatch.get(event.type)
+        if handler is None:
+            return []
+        return handler(event, memory)
+
+    def _handle_scan_requested(self, event: AgentEvent, memory: AgentMemory) -> List[Action]:
+        """Manual scan: rate-limit, then run the requested (or all) checkers."""
+        # GPT Review #4-5: manual scans intentionally bypass auto-scan cooldown,
+        # but enforce a shorter minimum interval to prevent rapid-fire abuse.
+        # GPT Review #5-5: return an explicit rate_limited action so the UI can
+        # display a clear message ("N초 후 다시 시도하세요").
+        if self._last_manual_scan:
+            elapsed = (datetime.now() - self._last_manual_scan).total_seconds()
+            if elapsed < self._manual_min_interval:
+                remaining = self._manual_min_interval - elapsed
+                logger.debug(
+                    f"Manual scan rate-limited: {elapsed:.1f}s < {self._manual_min_interval}s"
+                )
+                return [Action(
+                    "emit_insights",
+                    data={"rate_limited": True, "retry_after": round(remaining, 1)},
+                )]
+        self._last_manual_scan = datetime.now()
+
+        checkers = event.data.get("checkers")
+        if checkers:
+            valid = self._checker_names.intersection(checkers)
+            if not valid:
+                return []
+            return [Action("run_checkers", checker_names=sorted(valid))]
+        return [Action("run_checkers", checker_names=self._checker_names_sorted)]
+
+    def _handle_llm_request(self, event: AgentEvent, memory: AgentMemory) -> List[Action]:
+        """On-demand LLM analysis for one checker."""
+        checker = event.data.get("checker", "")
+        if not checker:
+            return []
+        return [Action("llm_analyze", data={"checker": checker})]
+
+    def _handle_scan_completed(self, event: AgentEvent, memory: AgentMemory) -> List[Action]:
+        """Post-scan: cross-checker insights + optional LLM escalation."""
         actions: List[Action] = []
 
-        if event.type == EventType.FILE_CHANGED:
-            actions.extend(self._handle_file_change(event, memory))
-
-        elif event.type == EventType.SCAN_REQUESTED:
-            # GPT Review #4-5: manual scans intentionally bypass auto-scan cooldown,
-            # but enforce a shorter minimum interval to prevent rapid-fire abuse.
-            # GPT Review #5-5: return an explicit rate_limited action so the UI can
-            # display a clear message ("N초 후 다시 시도하세요").
-            if self._last_manual_scan:
-                elapsed = (datetime.now() - self._last_manual_scan).total_seconds()
-                if elapsed < self._manual_min_interval:
-                    remaining = self._manual_min_interval - elapsed
-                    logger.debug(
-                        f"Manual scan rate-limited: {elapsed:.1f}s < {self._manual_min_interval}s"
-                    )
-                    actions.append(Action(
-                        "emit_insights",
-                        data={"rate_limited": True, "retry_after": round(remaining, 1)},
-                    ))
-                    return actions
-            self._last_manual_scan = datetime.now()
-
-            checkers = event.data.get("checkers")
-            if checkers:
-                valid = [c for c in checkers if c in self._checker_names]
-                if valid:
-                    actions.append(Action("run_checkers", checker_names=valid))
-            else:
-                actions.append(Action(
-                    "run_checkers",
-                    checker_names=sorted(self._checker_names)
-                ))
-
-        elif event.type == EventType.LLM_ANALYSIS_REQUESTED:
-            checker = event.data.get("checker", "")
-            if checker:
-                actions.append(Action("llm_analyze", data={"checker": checker}))
-
-        elif event.type == EventType.SCAN_COMPLETED:
-            # Cross-checker reasoning (post-scan)
-            insights = self._cross_checker_insights(event, memory)
-            if insights:
-                actions.append(Action("emit_insights", data={"insights": insights}))
-
-            # Auto-escalate to LLM on CRITICAL
-            if (self._auto_llm_on_critical
-                    and event.data.get("has_critical")
-                    and event.data.get("failing_checkers")):
-                for checker_name in event.data["failing_checkers"][:3]:
+        # Cross-checker reasoning (post-scan)
+        insights = self._cross_checker_insights(event, memory)
+        if insights:
+            actions.append(Action("emit_insights", data={"insights": insights}))
+
+        # Auto-escalate to LLM on CRITICAL
+        if self._auto_llm_on_critical:
+            data = event.data
+            failing = data.get("failing_checkers")
+            if failing and data.get("has_critical"):
+                for checker_name in failing[:3]:
                     actions.append(Action(
                         "llm_analyze",
                         data={"checker": checker_name}
@@ -120,20 +134,21 @@ class Reasoner:
                 return []
 
         # Stage 1: Use observer's pre-computed affected_checkers
-        affected = event.data.get("affected_checkers", [])
-        valid = [c for c in affected if c in self._checker_names]
+        affected = event.data.get("affected_checkers", ())
+        valid = self._checker_names.intersection(affected)
 
         if not valid:
             return []
 
         # Stage 2b: If too many checkers triggered, just run all
         # (avoids partial-scan confusion when many files change at once)
-        if len(valid) > len(self._checker_names) * 0.6:
+        if len(valid) > self._full_scan_threshold:
             logger.info("Many checkers affected, running full scan")
-            return [Action("run_checkers", checker_names=sorted(self._checker_names))]
+            return [Action("run_checkers", checker_names=self._checker_names_sorted)]
 
-        logger.info(f"File change → running checkers: {valid}")
-        return [Action("run_checkers", checker_names=valid)]
+        valid_sorted = sorted(valid)
+        logger.info(f"File change → running checkers: {valid_sorted}")
+        return [Action("run_checkers", checker_names=valid_sorted)]
 
     def _cross_checker_insights(self, event: AgentEvent, memory: AgentMemory) -> List[dict]:
         """Post-scan analysis: detect regressions and correlations.
@@ -147,34 +162,58 @@ class Reasoner:
 
         current, previous = recent[0], recent[1]
 
-        # 1. Regression detection: PASS → FAIL
+        # Single walk over the reports: regressions (PASS → FAIL), improvements
+        # (FAIL → PASS) and the failing-checker list are gathered together.
+        # Kept in separate lists so the emitted order stays regressions →
+        # correlation → improvements.
+        regressions: List[dict] = []
+        improvements: List[dict] = []
+        failing_checkers: List[str] = []
         for checker_name, cur_report in current.items():
+            if cur_report.get("fail_count", 0) > 0:
+                failing_checkers.append(checker_name)
             prev_report = previous.get(checker_name)
             if not prev_report:
                 continue
-            cur_fails = {
-                c["name"] for c in cur_report.get("checks", [])
-                if c["status"] == "FAIL"
-            }
+
+            cur_fails: Set[str] = set()
+            cur_passes: Set[str] = set()
+            for c in cur_report.get("checks", ()):
+                status = c["status"]
+                if status == "FAIL":
+                    cur_fails.add(c["name"])
+                elif status == "PASS":
+                    cur_passes.add(c["name"])
             prev_fails = {
-                c["name"] for c in prev_report.get("checks", [])
+                c["name"] for c in prev_report.get("checks", ())
                 if c["status"] == "FAIL"
             }
+
+            # 1. Regression detection: PASS → FAIL
             new_fails = cur_fails - prev_fails
             if new_fails:
-                insights.append({
+                new_fails_sorted = sorted(new_fails)
+                regressions.append({
                     "type": "regression",
                     "checker": checker_name,
-                    "message": f"New failures: {', '.join(sorted(new_fails))}",
+                    "message": f"New failures: {', '.join(new_fails_sorted)}",
                     "severity": "high",
-                    "details": {"new_fails": sorted(new_fails)},
+                    "details": {"new_fails": new_fails_sorted},
+                })
+
+            # 3. Improvement detection: FAIL → PASS
+            fixed = prev_fails & cur_passes
+            if fixed:
+                improvements.append({
+                    "type": "improvement",
+                    "checker": checker_name,
+                    "message": f"Fixed: {', '.join(sorted(fixed))}",
+                    "severity": "info",
                 })
 
+        insights.extend(regressions)
+
         # 2. Correlated failures: multiple checkers failing simultaneously
-        failing_checkers = [
-            name for name, report in current.items()
-            if report.get("fail_count", 0) > 0
-        ]
         if len(failing_checkers) >= 3:
             insights.append({
                 "type": "correlation",
@@ -185,26 +224,5 @@ class Reasoner:
                 "severity": "critical",
             })
 
-        # 3. Improvement detection: FAIL → PASS
-        for checker_name, cur_report in current.items():
-            prev_report = previous.get(checker_name)
-            if not prev_report:
-                continue
-            cur_passes = {
-                c["name"] for c in cur_report.get("checks", [])
-                if c["status"] == "PASS"
-            }
-            prev_fails = {
-                c["name"] for c in prev_report.get("checks", [])
-                if c["status"] == "FAIL"
-            }
-            fixed = prev_fails & cur_passes
-            if fixed:
-                insights.append({
-                    "type": "improvement",
-                    "checker": checker_name,
-                    "message": f"Fixed: {', '.join(sorted(fixed))}",
-                    "severity": "info",
-                })
-
+        insights.extend(improvements)
         return insights
@@ -60,78 +60,117 @@ class AgentSingletonLock:
         self._lock_dir = lock_dir
         self._lock_file = self._lock_dir / f"agent_{workspace_id}.lock"
         self._acquired = False
+        self._owned_payload = ""
 
     @property
     def is_acquired(self) -> bool:
         return self._acquired
 
     def acquire(self) -> bool:
-        """Try to acquire the lock. Returns True if successful."""
+        """Try to acquire the lock. Returns True if successful.
+
+        The lock file is created with O_CREAT|O_EXCL, so exactly one process
+        wins the create; a stale lock is reclaimed and the create retried once.
+        """
         self._lock_dir.mkdir(parents=True, exist_ok=True)
 
-        if self._lock_file.exists():
-            # Check if existing lock is stale
+        for _ in range(2):
             try:
-                content = self._lock_file.read_text().strip()
-                parts = content.split(":")
-                if len(parts) >= 2:
-                    pid = int(parts[0])
-                    lock_ts = float(parts[1]) if len(parts) >= 2 else 0
-                    lock_age = time.time() - lock_ts if lock_ts else float("inf")
-
-                    # Case 1: PID is dead → stale lock (crash/kill -9)
-                    if not self._pid_alive(pid):
-                        logger.info(
-                            f"Stale lock detected (PID {pid} dead). Reclaiming."
-                        )
-                        self._lock_file.unlink(missing_ok=True)
-
-                    # Case 2: PID alive but lock is extremely old
-                    # → PID was recycled by OS to a different process
-                    elif lock_age > self._max_age_seconds:
-                        logger.warning(
-                            f"Lock aged out ({lock_age:.0f}s > {self._max_age_seconds}s, "
-                            f"PID {pid} likely recycled). Reclaiming."
-                        )
-                        self._lock_file.unlink(missing_ok=True)
-
-                    # Case 3: PID alive and lock is fresh → genuine lock
-                    else:
-                        logger.warning(
-                            f"Agent already running for workspace {self._workspace_id} "
-                            f"(PID {pid}, age {lock_age:.0f}s). Skipping."
-                        )
-                        return False
-                else:
-                    # Malformed lock content
-                    logger.warning("Malformed lock file, removing")
-                    self._lock_file.unlink(missing_ok=True)
-            except (ValueError, OSError) as e:
-                logger.warning(f"Corrupt lock file, removing: {e}")
-                self._lock_file.unlink(missing_ok=True)
-
-        # Write our lock
-        try:
-            self._lock_file.write_text(
-                f"{os.getpid()}:{time.time():.0f}:{self._workspace_id}"
-            )
+                fd = os.open(
+                    str(self._lock_file), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644
+                )
+            except FileExistsError:
+                if not self._reclaim_stale():
+                    return False
+                continue
+            except OSError as e:
+                logger.error(f"Failed to create lock file: {e}")
+                return False
+
+            # Write our lock
+            payload = f"{os.getpid()}:{time.time():.0f}:{self._workspace_id}"
+            try:
+                os.write(fd, payload.encode())
+            finally:
+                os.close(fd)
+            self._owned_payload = payload
             self._acquired = True
             logger.info(
                 f"Agent lock acquired for workspace {self._workspace_id} "
                 f"(PID {os.getpid()})"
             )
             return True
+
+        # Another process re-created the lock between our reclaim and retry
+        logger.warning(
+            f"Agent lock for workspace {self._workspace_id} was taken concurrently. Skipping."
+        )
+        return False
+
+    def _reclaim_stale(self) -> bool:
+        """Inspect an existing lock file; remove it if stale.
+
+        Returns True if the lock was removed (caller may retry the create),
+        False if it is held by a live agent.
+        """
+        try:
+            content = self._lock_file.read_text().strip()
+        except FileNotFoundError:
+            return True  # released between our create and read
         except OSError as e:
-            logger.error(f"Failed to create lock file: {e}")
-            return False
+            logger.warning(f"Corrupt lock file, removing: {e}")
+            self._lock_file.unlink(missing_ok=True)
+            return True
+
+        try:
+            parts = content.split(":")
+            if len(parts) >= 2:
+                pid = int(parts[0])
+                lock_ts = float(parts[1]) if len(parts) >= 2 else 0
+                lock_age = time.time() - lock_ts if lock_ts else float("inf")
+
+                # Case 1: PID is dead → stale lock (crash/kill -9)
+                if not self._pid_alive(pid):
+                    logger.info(
+                        f"Stale lock detected (PID {pid} dead). Reclaiming."
+                    )
+                    self._lock_file.unlink(missing_ok=True)
+
+                # Case 2: PID alive but lock is extremely old
+                # → PID was recycled by OS to a different process
+                elif lock_age > self._max_age_seconds:
+                    logger.warning(
+                        f"Lock aged out ({lock_age:.0f}s > {self._max_age_seconds}s, "
+                        f"PID {pid} likely recycled). Reclaiming."
+                    )
+                    self._lock_file.unlink(missing_ok=True)
+
+                # Case 3: PID alive and lock is fresh → genuine lock
+                else:
+                    logger.warning(
+                        f"Agent already running for workspace {self._workspace_id} "
+                        f"(PID {pid}, age {lock_age:.0f}s). Skipping."
+                    )
+                    return False
+            else:
+                # Malformed lock content
+                logger.warning("Malformed lock file, removing")
+                self._lock_file.unlink(missing_ok=True)
+        except (ValueError, OSError) as e:
+            logger.warning(f"Corrupt lock file, removing: {e}")
+            self._lock_file.unlink(missing_ok=True)
+        return True
 
     def release(self):
-        """Release the lock."""
-        if self._acquired and self._lock_file.exists():
+        """Release the lock.
+
+        The file is only removed if it still holds the exact payload we wrote:
+        a peer may have reclaimed an aged-out lock (Case 2) and now owns it.
+        """
+        if self._acquired:
             try:
                 # Only remove if we own it
-                content = self._lock_file.read_text().strip()
-                if content.startswith(f"{os.getpid()}:"):
+                if self._lock_file.read_text().strip() == self._owned_payload:
                     self._lock_file.unlink(missing_ok=True)
                     logger.info(
                         f"Agent lock released for workspace {self._workspace_id}"
@@ -17,14 +17,29 @@ GPT Review hardening:
 """
 import json
 import itertools
+from collections import OrderedDict
+from datetime import datetime
 from queue import Empty
 from flask import Blueprint, jsonify, request, Response
 
+from . import storage as st
+
+try:
+    import orjson  # optional C-accelerated JSON (falls back to stdlib json)
+except ImportError:
+    orjson = None
+
 agent_bp = Blueprint("agent", __name__)
 
 # Set by app.py when agent mode is active (per-workspace)
 _agent_loops = {}   # workspace_id → AgentLoop
 
+# _get_loop() memo: (epoch, requested ws_id) → (loop, resolved ws_id).
+# The epoch is bumped whenever _agent_loops changes, so stale entries never hit.
+_RESOLVE_CACHE_SIZE = 128
+_loops_epoch = 0
+_resolve_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
 # GPT Review #3C: monotonic event ID counter for SSE reconnection.
 # GPT Review #6-4: this counter is GLOBAL (not per-workspace).
 # Since it's a single monotonic sequence, JS dedupe with a bounded set
@@ -32,23 +47,53 @@ _agent_loops = {}   # workspace_id → AgentLoop
 _sse_event_counter = itertools.count(1)
 
 
+def _dumps(obj) -> str:
+    """Compact JSON text for SSE frames (orjson when installed)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, default=str).decode("utf-8")
+        except TypeError:
+            pass  # e.g. int > 64-bit — let stdlib json handle it
+    return json.dumps(obj, ensure_ascii=False, default=str, separators=(",", ":"))
+
+# Frames are yielded as bytes so Werkzeug writes them without re-encoding
+_HEARTBEAT = b": heartbeat\n\n"
+
+
+def _sse_frame(eid: int, payload: bytes) -> bytes:
+    """One `id:`/`data:` SSE frame, built in a single buffer."""
+    return b"id: %d\ndata: %b\n\n" % (eid, payload)
+
+
 def init_agent_blueprint(workspace_id: str, agent_loop):
     """Register an AgentLoop for a workspace."""
+    global _loops_epoch
     _agent_loops[workspace_id] = agent_loop
+    _loops_epoch += 1
+    _resolve_cache.clear()
 
 
 def _get_loop():
     """Get the AgentLoop for the current workspace (from cookie or default)."""
-    ws_id = request.args.get("workspace_id", "")
-    if not ws_id:
-        ws_id = request.cookies.get("dd_workspace", "")
-    if ws_id and ws_id in _agent_loops:
-        return _agent_loops[ws_id], ws_id
-    # Return first available
-    if _agent_loops:
+    requested = request.args.get("workspace_id", "") or request.cookies.get("dd_workspace", "")
+    key = (_loops_epoch, requested)
+    hit = _resolve_cache.get(key)
+    if hit is not None:
+        return hit
+
+    if requested and requested in _agent_loops:
+        resolved = (_agent_loops[requested], requested)
+    elif _agent_loops:
+        # Return first available
         ws_id = next(iter(_agent_loops))
-        return _agent_loops[ws_id], ws_id
-    return None, ""
+        resolved = (_agent_loops[ws_id], ws_id)
+    else:
+        return None, ""  # nothing registered yet — don't memoize
+
+    _resolve_cache[key] = resolved
+    if len(_resolve_cache) > _RESOLVE_CACHE_SIZE:
+        _resolve_cache.popitem(last=False)
+    return resolved
 
 
 @agent_bp.route("/api/agent/status")
@@ -108,10 +153,9 @@ def agent_scan():
     # share the same rate-limit, but different workspaces are independent.
     # The API sets _last_manual_scan eagerly so consecutive rapid API calls
     # are caught even before the background loop processes the event.
-    from datetime import datetime as _dt
     reasoner = loop.reasoner
     if reasoner._last_manual_scan:
-        elapsed = (_dt.now() - reasoner._last_manual_scan).total_seconds()
+        elapsed = (datetime.now() - reasoner._last_manual_scan).total_seconds()
         min_interval = reasoner._manual_min_interval
         if elapsed < min_interval:
             remaining = round(min_interval - elapsed, 1)
@@ -123,7 +167,7 @@ def agent_scan():
             })
 
     # Eagerly mark scan time so immediate re-calls are rate-limited at API level
-    reasoner._last_manual_scan = _dt.now()
+    reasoner._last_manual_scan = datetime.now()
     loop.request_scan(checker_names)
     return jsonify({"success": True, "message": "Scan queued"})
 
@@ -162,13 +206,19 @@ def agent_events_sse():
     # GPT Review #3C: support Last-Event-ID for reconnection
     last_event_id = request.headers.get("Last-Event-ID", "")
 
-    client_queue = loop.register_sse_client()
+    client_queue, first_seq = loop.register_sse_client()
+    # Idle connections only wake to send a heartbeat; keep it just under the
+    # common 60s proxy idle timeout
+    heartbeat_seconds = loop.config.get("agent", {}).get("sse_heartbeat_seconds", 55)
 
     def generate():
+        # Bound once per connection: no global/attribute lookup per frame.
+        # Ids are drawn one at a time — the counter is shared by every
+        # connection's thread, so a reserved block would not stay contiguous.
+        next_eid = _sse_event_counter.__next__
         # If reconnecting, send missed events from storage first
         if last_event_id:
             try:
-                from . import storage as st
                 # GPT Review #4-3: configurable replay limit
                 replay_limit = loop.config.get("agent", {}).get("sse_replay_limit", 50)
                 missed = st.get_agent_events(
@@ -191,7 +241,7 @@ def agent_events_sse():
                     except (ValueError, TypeError):
                         dropped_estimate = -1  # unknown
 
-                    eid = next(_sse_event_counter)
+                    eid = next_eid()
                     gap_data = {
                         "type": "_gap",
                         "data": {
@@ -203,39 +253,49 @@ def agent_events_sse():
                             "dropped_count": max(dropped_estimate, 0),
                         },
                     }
-                    yield f"id: {eid}\ndata: {json.dumps(gap_data, ensure_ascii=False, default=str)}\n\n"
+                    yield _sse_frame(eid, _dumps(gap_data).encode("utf-8"))
 
                 # Reverse to chronological order (storage returns DESC)
+                # Stored data_json is always encoder output (AgentEvent.data_json),
+                # so it is spliced into the frame as-is instead of parsed + re-dumped
                 for evt in reversed(missed):
-                    eid = next(_sse_event_counter)
-                    data = {
+                    eid = next_eid()
+                    envelope = _dumps({
                         "type": evt.get("event_type", "unknown"),
                         "timestamp": evt.get("timestamp", ""),
                         "source": evt.get("source", ""),
                         "workspace_id": evt.get("workspace_id", ""),
-                        "data": json.loads(evt.get("data_json", "{}")),
-                        "_replay": True,
-                    }
-                    yield f"id: {eid}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+                    })
+                    raw = evt.get("data_json") or "{}"
+                    frame = f'{envelope[:-1]},"data":{raw},"_replay":true}}'
+                    yield _sse_frame(eid, frame.encode("utf-8"))
             except Exception:
                 pass  # Best-effort replay
 
+        expected_seq = first_seq
         try:
             while True:
                 try:
-                    event = client_queue.get(timeout=30)
-                    eid = next(_sse_event_counter)
-                    data = {
-                        "type": event.type.value,
-                        "timestamp": event.timestamp.isoformat(),
-                        "source": event.source,
-                        "workspace_id": event.workspace_id,
-                        "data": event.data,
-                    }
-                    yield f"id: {eid}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+                    seq, event = client_queue.get(timeout=heartbeat_seconds)
+                    if seq != expected_seq:
+                        # Our bounded queue dropped its oldest events while this
+                        # client lagged — say so instead of skipping silently
+                        skipped = seq - expected_seq
+                        yield _sse_frame(next_eid(), _dumps({
+                            "type": "_gap",
+                            "data": {
+                                "message": f"수신 지연으로 실시간 이벤트 {skipped}개를 건너뛰었습니다. 전체 내역은 History에서 확인하세요.",
+                                "dropped_count": skipped,
+                                "lagged": True,
+                            },
+                        }).encode("utf-8"))
+                    expected_seq = seq + 1
+                    eid = next_eid()
+                    # Wire bytes are encoded once per event (shared by all clients)
+                    yield _sse_frame(eid, event.wire_bytes())
                 except Empty:
                     # Heartbeat to keep connection alive
-                    yield f": heartbeat\n\n"
+                    yield _HEARTBEAT
         except GeneratorExit:
             pass
         finally:
@@ -258,7 +318,6 @@ def agent_event_history():
 
     GPT Review #3D: workspace_id is always resolved — never returns cross-workspace data.
     """
-    from . import storage as st
     limit = request.args.get("limit", 100, type=int)
     since_id = request.args.get("since_id", 0, type=int)
     # GPT Review #3D: always enforce workspace boundary
@@ -274,7 +333,6 @@ def agent_analyses():
 
     GPT Review #3D: workspace_id is always resolved — never returns cross-workspace data.
     """
-    from . import storage as st
     limit = request.args.get("limit", 20, type=int)
     # GPT Review #3D: always enforce workspace boundary
     _, resolved_ws_id = _get_loop()
@@ -13,28 +13,62 @@ Usage:
     app.run(port=5010)
 """
 
+import atexit
+import copy
+import functools
 import hashlib
 import json
+import os
+import pickle
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
-from flask import Flask, jsonify, make_response, render_template, Response, request
+from flask import Flask, g, jsonify, make_response, render_template, Response, request
 
 from .scanner.base import PhaseReport, CheckResult, BaseChecker
 from .scanner.registry import CheckerRegistry
 from . import storage
 
+try:
+    from yaml import CSafeLoader as _YAMLLoader, CSafeDumper as _YAMLDumper  # libyaml-backed (much faster)
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader, SafeDumper as _YAMLDumper
+
+try:
+    import orjson  # optional C-accelerated JSON (falls back to stdlib json)
+except ImportError:
+    orjson = None
+
+try:
+    # Imported once here, not per request (litellm itself stays lazy inside)
+    from .llm.provider import LLMProvider
+    from .llm.prompts import parse_analysis_response
+except ImportError:
+    LLMProvider = None
+    parse_analysis_response = None
+
 
 # ── Helpers ────────────────────────────────────────────
 
 def deep_merge(base: dict, override: dict) -> dict:
-    """Recursively merge override into base. Override values win."""
+    """Recursively merge override into base. Override values win.
+
+    The result's top level is always a new dict, and so is every dict set on
+    both sides (even when the override is empty — callers mutate nested
+    sections like config["llm"] in place). Everything else is shared with
+    the inputs, as untouched keys always were.
+    """
     result = base.copy()
+    if not override:
+        return result
     for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
+        existing = result.get(key)
+        if isinstance(existing, dict) and isinstance(value, dict):
+            result[key] = deep_merge(existing, value)
         else:
             result[key] = value
     return result
@@ -47,9 +81,135 @@ def _validate_config(config: dict) -> dict:
     return config
 
 
+# path → (st_mtime_ns, st_size, parsed YAML); a changed file misses on its stat
+_YAML_CACHE: Dict[str, tuple] = {}
+
+# Compiled (pickled) parses survive restarts. They live in a yaml_cache dir
+# next to the dashboard DB (set by create_app, which is also how the cache is
+# turned off: create_app(..., yaml_cache=False)); None disables it. Records
+# are keyed on a digest of the file's bytes, so a same-size edit inside the
+# filesystem's mtime granularity can never be served stale across restarts.
+_YAML_DISK_CACHE_DIR: Optional[Path] = None
+_YAML_DISK_CACHE_MAX_FILES = 64  # oldest records are pruned past this
+
+
+def _configure_yaml_cache(cache_dir: Optional[Path]):
+    """Point the compiled YAML cache at `cache_dir` (None disables it)."""
+    global _YAML_DISK_CACHE_DIR
+    _YAML_DISK_CACHE_DIR = cache_dir
+
+
+def _yaml_disk_cache_path(key: str) -> Path:
+    return _YAML_DISK_CACHE_DIR / f"{hashlib.blake2b(key.encode(), digest_size=8).hexdigest()}.pickle"
+
+
+def _prune_yaml_disk_cache():
+    """Drop the oldest compiled records beyond _YAML_DISK_CACHE_MAX_FILES."""
+    records = sorted(_YAML_DISK_CACHE_DIR.glob("*.pickle"), key=lambda p: p.stat().st_mtime_ns)
+    for old in records[:-_YAML_DISK_CACHE_MAX_FILES]:
+        old.unlink(missing_ok=True)
+
+
+def _load_yaml_cached(path: Path) -> dict:
+    """Parse a YAML config file, reusing the previous parse while it is unchanged.
+
+    Lookup order: in-process cache → compiled cache on disk (when configured)
+    → YAML parse (which refreshes both). Returns a deep copy — callers merge
+    and mutate their config freely.
+    """
+    st = path.stat()
+    key = str(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    hit = _YAML_CACHE.get(key)
+    if hit is not None and hit[:2] == stamp:
+        return copy.deepcopy(hit[2])
+
+    if _YAML_DISK_CACHE_DIR is None:
+        # Binary handle: libyaml reads and decodes the stream itself in chunks
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=_YAMLLoader) or {}
+    else:
+        raw = path.read_bytes()
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+        cache_path = _yaml_disk_cache_path(key)
+        data = None
+        try:
+            cached_key, cached_digest, cached_data = pickle.loads(cache_path.read_bytes())
+            if cached_key == key and cached_digest == digest:
+                data = cached_data
+        except Exception:
+            pass  # missing / corrupt / stale format — parse instead
+
+        if data is None:
+            data = yaml.load(raw, Loader=_YAMLLoader) or {}
+            try:
+                _YAML_DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                tmp = cache_path.with_suffix(f".{os.getpid()}.tmp")
+                tmp.write_bytes(pickle.dumps((key, digest, data), protocol=5))
+                os.replace(tmp, cache_path)
+                _prune_yaml_disk_cache()
+            except Exception:
+                pass  # cache is best-effort
+
+    _YAML_CACHE[key] = (*stamp, data)
+    return copy.deepcopy(data)
+
+
+def _sse(obj) -> bytes:
+    """One `data:` SSE frame as bytes (orjson when installed)."""
+    if orjson is not None:
+        try:
+            return b"data: " + orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS) + b"\n\n"
+        except TypeError:
+            pass  # e.g. int > 64-bit — let stdlib json handle it
+    return f"data: {json.dumps(obj, ensure_ascii=False)}\n\n".encode("utf-8")
+
+
+def _json_response(payload) -> Response:
+    """JSON response for large payloads — orjson straight to bytes when installed."""
+    if orjson is not None:
+        try:
+            return Response(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS),
+                            mimetype="application/json")
+        except TypeError:
+            pass  # e.g. int > 64-bit — let Flask's encoder handle it
+    return jsonify(payload)
+
+
+# Folder browser: a subdirectory containing any of these looks like a project
+_PROJECT_MARKERS = frozenset({
+    "app.py", "main.py", "manage.py", "setup.py", "pyproject.toml",
+    "package.json", "Cargo.toml", "go.mod", "Makefile",
+    "requirements.txt", ".git", ".debugger",
+})
+
+# Provider prefix → env var name mapping
+_PROVIDER_ENV_MAP = {
+    "anthropic/": "ANTHROPIC_API_KEY",
+    "openai/":    "OPENAI_API_KEY",
+    "gemini/":    "GEMINI_API_KEY",
+    "deepseek/":  "DEEPSEEK_API_KEY",
+}
+_PROVIDER_ENV_TUPLES = tuple(_PROVIDER_ENV_MAP.items())
+
+
+@functools.lru_cache(maxsize=128)
+def _env_var_for_model(model: str) -> str:
+    """Return the conventional env var name for a model string."""
+    for prefix, env_var in _PROVIDER_ENV_TUPLES:
+        if model.startswith(prefix):
+            return env_var
+    return ""
+
+
 def _make_ws_id(config_path: Path) -> str:
-    """Generate workspace ID from config path hash (10-char hex)."""
-    return hashlib.sha1(str(config_path.resolve()).encode()).hexdigest()[:10]
+    """Generate workspace ID from an already-resolved config path (10-char hex).
+
+    Stays SHA-1: the ID is persisted (scan history project names, agent
+    event/analysis rows, lock files, the dd_workspace cookie), so changing
+    the hash would orphan existing data. It runs once per workspace load.
+    """
+    return hashlib.sha1(str(config_path).encode()).hexdigest()[:10]
 
 
 # ── Workspace Persistence ─────────────────────────────
@@ -71,6 +231,22 @@ def _load_saved_workspaces(config_path: Path) -> List[str]:
         return []
 
 
+# LLMProvider reads these from config.llm at construction; while they are
+# unchanged a workspace keeps its provider (and its daily cost tracking)
+_LLM_PROVIDER_FIELDS = (
+    "model", "fallback_model", "temperature", "max_tokens", "timeout_seconds", "daily_budget_usd",
+)
+
+# llm_overview reuses the last full scan (scan/run or scan/export) of a
+# workspace instead of re-running every checker, if it is at most this old
+_SCAN_SNAPSHOT_TTL_SECONDS = 60
+
+
+# Add/remove bursts (e.g. several folders picked in the browser) are
+# coalesced into one workspaces.json write after this quiet period
+_WS_PERSIST_DELAY_SECONDS = 0.5
+
+
 def _save_workspace_registry(config_path: Path, workspaces: Dict[str, dict],
                               default_ws_id: str) -> None:
     """Persist extra workspace config paths to workspaces.json."""
@@ -83,10 +259,14 @@ def _save_workspace_registry(config_path: Path, workspaces: Dict[str, dict],
             extras.append(str(cfg_path))
 
     reg = _ws_registry_path(config_path)
-    reg.write_text(json.dumps({
+    payload = json.dumps({
         "extra_workspaces": extras,
         "_note": "Auto-managed by Debug Dashboard. Persists UI-added workspaces across restarts."
-    }, indent=2, ensure_ascii=False), encoding="utf-8")
+    }, separators=(",", ":"), ensure_ascii=False)
+    # Write-then-rename: a crash mid-write never leaves a truncated registry
+    tmp = reg.with_name(f"{reg.name}.{os.getpid()}.tmp")
+    tmp.write_text(payload, encoding="utf-8")
+    os.replace(tmp, reg)
 
 
 # ── Workspace Loading ──────────────────────────────────
@@ -97,8 +277,7 @@ def _load_workspace(config_path: Path, defaults: dict) -> dict:
 
     project_config = {}
     if config_path.exists():
-        with open(config_path, encoding="utf-8") as f:
-            project_config = yaml.safe_load(f) or {}
+        project_config = _load_yaml_cached(config_path)
 
     config = deep_merge(defaults, project_config)
     config = _validate_config(config)
@@ -123,24 +302,22 @@ def _load_workspace(config_path: Path, defaults: dict) -> dict:
 
 def _resolve_plugin_dirs(config: dict, config_path: Path,
                          extra_plugin_dirs: List[str] = None) -> List[str]:
-    """Resolve plugin directories from config + extra args. Returns list of absolute paths."""
-    all_dirs = list(extra_plugin_dirs or [])
-    config_dirs = config.get("plugins", {}).get("dirs", [])
-    for d in config_dirs:
-        p = Path(d)
-        if not p.is_absolute():
-            p = config_path.parent / p
-        p_str = str(p.resolve())
-        if p_str not in [str(Path(x).resolve()) for x in all_dirs]:
-            all_dirs.append(p_str)
+    """Resolve plugin directories from config + extra args. Returns list of absolute paths.
 
-    # Resolve any remaining relative paths
+    Extra dirs come first; each path is resolved once (relative to the config
+    file's directory) and duplicates are dropped.
+    """
+    base = config_path.parent
+    seen = set()
     resolved = []
-    for d in all_dirs:
+    for d in (*(extra_plugin_dirs or ()), *config.get("plugins", {}).get("dirs", [])):
         p = Path(d)
         if not p.is_absolute():
-            p = config_path.parent / p
-        resolved.append(str(p.resolve()))
+            p = base / p
+        p_str = str(p.resolve())
+        if p_str not in seen:
+            seen.add(p_str)
+            resolved.append(p_str)
     return resolved
 
 
@@ -174,8 +351,9 @@ def _init_registry_for(ws: dict) -> List[BaseChecker]:
         ordered = []
         for name in valid_order:
             ordered.append(checkers_dict[name])
+        valid_set = set(valid_order)
         for name, checker in checkers_dict.items():
-            if name not in valid_order:
+            if name not in valid_set:
                 ordered.append(checker)
     else:
         ordered = list(checkers_dict.values())
@@ -185,11 +363,166 @@ def _init_registry_for(ws: dict) -> List[BaseChecker]:
     return enabled
 
 
+# ── Scan Helpers ───────────────────────────────────────
+
+_DETAILS_ENCODER = json.JSONEncoder(default=str)
+
+
+def _truncate_json(obj: Any, limit: int) -> str:
+    """json.dumps(obj, default=str), cut to `limit` chars plus "..." when longer.
+
+    Encodes incrementally and stops once past the limit, so a huge details
+    blob is never serialized in full just to keep its first few hundred chars.
+    """
+    parts: List[str] = []
+    size = 0
+    for chunk in _DETAILS_ENCODER.iterencode(obj):
+        parts.append(chunk)
+        size += len(chunk)
+        if size > limit:
+            return "".join(parts)[:limit] + "..."
+    return "".join(parts)
+
+
+def _run_checker_timed(checker: BaseChecker, project_root: Path,
+                       config: dict) -> Tuple[Optional[PhaseReport], Optional[Exception], int]:
+    """Run one checker → (report or None, error or None, duration_ms)."""
+    t0 = time.perf_counter_ns()
+    try:
+        report, error = checker.run(project_root, config), None
+    except Exception as e:
+        report, error = None, e
+    return report, error, (time.perf_counter_ns() - t0) // 1_000_000
+
+
+def _run_checkers_concurrently(checkers: List[BaseChecker], project_root: Path,
+                               config: dict) -> List[tuple]:
+    """Run checkers on a thread pool; results come back in input order.
+
+    Checkers are read-only and mostly I/O-bound (file walks, subprocesses),
+    so wall time drops to roughly the slowest phase. If any checker declares
+    depends_on, the list is run sequentially to keep that ordering guarantee.
+    """
+    if len(checkers) <= 1 or any(c.depends_on for c in checkers):
+        return [_run_checker_timed(c, project_root, config) for c in checkers]
+    workers = min(len(checkers), (os.cpu_count() or 4) * 2)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="checker") as pool:
+        return list(pool.map(lambda c: _run_checker_timed(c, project_root, config), checkers))
+
+
+# ── Report Export ──────────────────────────────────────
+
+_STATUS_SYMBOLS = {"PASS": "✅", "WARN": "⚠️", "FAIL": "❌", "SKIP": "⏭️"}
+
+
+def _iter_markdown_report(all_reports: List[dict], *, project_name: str, ws_root: str,
+                          now: str, elapsed: int, overall: str, health_pct: float,
+                          totals: tuple):
+    """Yield the Markdown scan report as UTF-8 chunks, one per section."""
+    total_pass, total_warn, total_fail, total_skip = totals
+    status_emoji = {"CRITICAL": "🔴", "DEGRADED": "🟡", "HEALTHY": "🟢"}.get(overall, "⚪")
+
+    yield (
+        f"# 🏥 System Diagnostics Report\n"
+        f"\n"
+        f"> **Project**: {project_name}\n"
+        f"> **Root**: `{ws_root}`\n"
+        f"> **Generated**: {now}\n"
+        f"> **Duration**: {elapsed}ms\n"
+        f"\n"
+        f"## {status_emoji} Overall Status: **{overall}**\n"
+        f"\n"
+        f"| Metric | Count |\n"
+        f"|--------|-------|\n"
+        f"| ✅ PASS | {total_pass} |\n"
+        f"| ⚠️ WARN | {total_warn} |\n"
+        f"| ❌ FAIL | {total_fail} |\n"
+        f"| ⏭️ SKIP | {total_skip} |\n"
+        f"| **Health** | **{health_pct:.1f}%** |\n"
+        f"\n"
+        f"---\n"
+        f"\n"
+    ).encode("utf-8")
+
+    action_items = []
+    for r in all_reports:
+        meta = r.get("meta", {})
+        icon = meta.get("icon", "")
+        display = meta.get("display_name", r.get("name", "?"))
+        checks = r.get("checks", [])
+        wc = r.get("warn_count", 0)
+        fc = r.get("fail_count", 0)
+        sc = r.get("skip_count", 0)
+
+        if fc > 0:
+            phase_status = "🔴 FAIL"
+        elif wc > 0:
+            phase_status = "🟡 WARN"
+        elif sc == len(checks):
+            phase_status = "⚪ SKIP"
+        else:
+            phase_status = "🟢 PASS"
+
+        parts = [f"## {icon} {display}  —  {phase_status}\n\n"]
+        if meta.get("tooltip_why"):
+            parts.append(f"> {meta['tooltip_why']}\n\n")
+        parts.append("| Status | Check | Message |\n|--------|-------|---------|\n")
+
+        detail_checks = []
+        for c in checks:
+            st = c.get("status", "?")
+            msg = c.get("message", "").replace("|", "\\|")
+            parts.append(f"| {_STATUS_SYMBOLS.get(st, '?')} {st} | `{c.get('name', '?')}` | {msg} |\n")
+            if st == "FAIL":
+                action_items.append(f"❌ **{display}** → `{c['name']}`: {c.get('message', '')}")
+            elif st == "WARN" and c.get("fixable"):
+                action_items.append(f"🔧 **{display}** → `{c['name']}`: {c.get('fix_desc', '')}")
+            if st in ("WARN", "FAIL") and c.get("details"):
+                detail_checks.append(c)
+        parts.append("\n")
+
+        # Details section for non-PASS checks
+        if detail_checks:
+            parts.append(f"<details>\n<summary>📋 Details ({len(detail_checks)} items)</summary>\n\n")
+            for c in detail_checks:
+                parts.append(f"**{c['name']}**:\n")
+                d = c["details"]
+                if isinstance(d, list):
+                    for item in d[:10]:
+                        if isinstance(item, dict):
+                            parts.append(f"- {', '.join(f'{k}=`{v}`' for k, v in item.items())}\n")
+                        else:
+                            parts.append(f"- `{item}`\n")
+                elif isinstance(d, dict):
+                    for k, v in list(d.items())[:10]:
+                        if isinstance(v, list):
+                            parts.append(f"- **{k}**: {', '.join(f'`{x}`' for x in v[:10])}\n")
+                        else:
+                            parts.append(f"- **{k}**: `{v}`\n")
+                parts.append("\n")
+                if c.get("fixable"):
+                    parts.append(f"  🔧 **Auto-fix**: {c.get('fix_desc', '')}\n\n")
+            parts.append("</details>\n\n")
+
+        parts.append("---\n\n")
+        yield "".join(parts).encode("utf-8")
+
+    # Action items summary
+    tail = []
+    if action_items:
+        tail.append("## 🎯 Action Items\n\n")
+        tail.extend(f"{i}. {item}\n" for i, item in enumerate(action_items, 1))
+        tail.append("\n")
+    tail.append(f"---\n*Generated by Debug Dashboard Core • {now}*")
+    yield "".join(tail).encode("utf-8")
+
+
 # ── App Factory ────────────────────────────────────────
 
 def create_app(config_path: str, db_path: str = None,
                plugin_dirs: List[str] = None,
-               extra_workspaces: List[str] = None) -> Flask:
+               extra_workspaces: List[str] = None,
+               yaml_cache: bool = True) -> Flask:
     """Create a Flask debug dashboard app.
 
     Args:
@@ -197,16 +530,24 @@ def create_app(config_path: str, db_path: str = None,
         db_path: Override for dashboard SQLite DB location
         plugin_dirs: Additional plugin directories (merged with config.plugins.dirs)
         extra_workspaces: Additional workspace config.yaml paths for multi-workspace mode
+        yaml_cache: Keep compiled config parses in a yaml_cache dir next to the DB
     """
     CORE_DIR = Path(__file__).parent
     config_path = Path(config_path).resolve()
 
+    # ── Storage setup ── (before config loads: the YAML cache lives beside the DB)
+    if db_path:
+        storage.configure(Path(db_path))
+    else:
+        default_db = config_path.parent / "debug_dashboard.db"
+        storage.configure(default_db)
+    _configure_yaml_cache(storage.DB_PATH.parent / "yaml_cache" if yaml_cache else None)
+
     # Load defaults
     defaults_path = CORE_DIR / "defaults.yaml"
     defaults = {}
     if defaults_path.exists():
-        with open(defaults_path, encoding="utf-8") as f:
-            defaults = yaml.safe_load(f) or {}
+        defaults = _load_yaml_cached(defaults_path)
 
     # ── Load workspaces ──
     main_ws = _load_workspace(config_path, defaults)
@@ -236,12 +577,6 @@ def create_app(config_path: str, db_path: str = None,
         except Exception as e:
             print(f"[workspace] ⚠ Failed to load {extra_path}: {e}")
 
-    # ── Storage setup ──
-    if db_path:
-        storage.configure(Path(db_path))
-    else:
-        default_db = config_path.parent / "debug_dashboard.db"
-        storage.configure(default_db)
     storage.init_db()
 
     # ── Flask app ──
@@ -251,33 +586,130 @@ def create_app(config_path: str, db_path: str = None,
 
     app.config["WORKSPACES"] = workspaces
     app.config["DEFAULT_WORKSPACE"] = main_ws["id"]
-    app.config["REGISTRIES"] = {}  # ws_id → list of checker instances (lazy init)
+    app.config["REGISTRIES"] = {}  # ws_id → {"ordered": [checkers], "by_name": {name: checker}} (lazy init)
     app.config["MONITOR_CONNECTORS"] = {}  # ws_id → MainServiceConnector (per-workspace)
     app.config["_PRIMARY_CONFIG_PATH"] = str(config_path)  # for workspace persistence
+    app.config["_WS_LIST_CACHE"] = None  # [{id, name, root}] — rebuilt after add/remove
+    app.config["LAST_SCAN"] = {}  # ws_id → {"ts": monotonic seconds, "reports": [report dicts]}
+    app.config["LLM_PROVIDERS"] = {}  # ws_id → (llm settings tuple, LLMProvider)
 
     # ── Workspace helpers (request-scoped) ──
 
     def _current_ws_id() -> str:
-        """Get current workspace ID from cookie (falls back to default)."""
-        ws_id = request.cookies.get("dd_workspace")
-        if ws_id and ws_id in app.config["WORKSPACES"]:
-            return ws_id
-        return app.config["DEFAULT_WORKSPACE"]
+        """Get current workspace ID from cookie (falls back to default).
+
+        Resolved once per request and kept on flask.g.
+        """
+        ws_id = g.get("ws_id")
+        if ws_id is None:
+            ws_id = request.cookies.get("dd_workspace")
+            if not (ws_id and ws_id in app.config["WORKSPACES"]):
+                ws_id = app.config["DEFAULT_WORKSPACE"]
+            g.ws_id = ws_id
+        return ws_id
 
     def _get_ws() -> dict:
         """Get current workspace dict."""
         return app.config["WORKSPACES"][_current_ws_id()]
 
-    def _get_checkers(ws_id: str = None) -> List[BaseChecker]:
-        """Get checkers for a workspace (lazy init + cache)."""
+    def _get_registry(ws_id: str = None) -> dict:
+        """Get a workspace's checker registry entry (lazy init + cache)."""
         if ws_id is None:
             ws_id = _current_ws_id()
-        if ws_id not in app.config["REGISTRIES"]:
+        entry = app.config["REGISTRIES"].get(ws_id)
+        if entry is None:
             ws = app.config["WORKSPACES"][ws_id]
             checkers = _init_registry_for(ws)
-            app.config["REGISTRIES"][ws_id] = checkers
+            entry = {"ordered": checkers, "by_name": {c.name: c for c in checkers}}
+            app.config["REGISTRIES"][ws_id] = entry
             print(f"[registry:{ws_id}] Loaded {len(checkers)} checkers for '{ws['name']}'")
-        return app.config["REGISTRIES"][ws_id]
+        return entry
+
+    def _get_checkers(ws_id: str = None) -> List[BaseChecker]:
+        """Get checkers for a workspace, in run order."""
+        return _get_registry(ws_id)["ordered"]
+
+    def _get_checker_map(ws_id: str = None) -> Dict[str, BaseChecker]:
+        """Get a workspace's checkers keyed by name."""
+        return _get_registry(ws_id)["by_name"]
+
+    def _remember_scan(ws_id: str, reports: List[dict]) -> None:
+        """Record a finished full scan for reuse by llm_overview.
+
+        `reports` must exclude crashed checkers' error placeholders, matching
+        what llm_overview collects when it runs the checkers itself.
+        """
+        app.config["LAST_SCAN"][ws_id] = {"ts": time.monotonic(), "reports": reports}
+
+    def _recent_scan_reports(ws_id: str) -> Optional[List[dict]]:
+        """Report dicts of the workspace's last full scan, if still fresh."""
+        snap = app.config["LAST_SCAN"].get(ws_id)
+        if snap and time.monotonic() - snap["ts"] < _SCAN_SNAPSHOT_TTL_SECONDS:
+            return snap["reports"]
+        return None
+
+    def _llm_provider_for(ws_id: str, config: dict):
+        """LLMProvider for a workspace, reused while its llm settings are unchanged.
+
+        API keys live in the environment and are read at call time, so a
+        key change alone does not need a new provider.
+        """
+        llm_cfg = config.get("llm", {})
+        key = tuple(llm_cfg.get(f) for f in _LLM_PROVIDER_FIELDS)
+        cached = app.config["LLM_PROVIDERS"].get(ws_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        provider = LLMProvider(config)
+        app.config["LLM_PROVIDERS"][ws_id] = (key, provider)
+        return provider
+
+    def _ws_list_base() -> List[dict]:
+        """Static part of the workspace list (cached; see _invalidate_ws_cache)."""
+        cached = app.config["_WS_LIST_CACHE"]
+        if cached is None:
+            cached = [
+                {"id": wid, "name": w["name"], "root": str(w["project_root"])}
+                for wid, w in app.config["WORKSPACES"].items()
+            ]
+            app.config["_WS_LIST_CACHE"] = cached
+        return cached
+
+    def _invalidate_ws_cache():
+        app.config["_WS_LIST_CACHE"] = None
+
+    _ws_persist_lock = threading.Lock()
+    _ws_persist_state = {"timer": None, "pending": False}
+
+    def _persist_ws_registry_now():
+        """Write workspaces.json if a change is pending (timer thread / exit)."""
+        # Written under the lock so two writes can never land out of order
+        with _ws_persist_lock:
+            if not _ws_persist_state["pending"]:
+                return
+            _ws_persist_state["pending"] = False
+            _ws_persist_state["timer"] = None
+            try:
+                _save_workspace_registry(
+                    config_path=Path(app.config["_PRIMARY_CONFIG_PATH"]),
+                    workspaces=dict(app.config["WORKSPACES"]),
+                    default_ws_id=app.config["DEFAULT_WORKSPACE"],
+                )
+            except Exception as pe:
+                print(f"[workspace] ⚠ Persist failed: {pe}")
+
+    def _schedule_ws_registry_persist():
+        """Debounced workspaces.json write (restarts the quiet-period timer)."""
+        with _ws_persist_lock:
+            if _ws_persist_state["timer"] is not None:
+                _ws_persist_state["timer"].cancel()
+            timer = threading.Timer(_WS_PERSIST_DELAY_SECONDS, _persist_ws_registry_now)
+            timer.daemon = True
+            _ws_persist_state["timer"] = timer
+            _ws_persist_state["pending"] = True
+            timer.start()
+
+    # The timer thread is a daemon — flush a pending write at interpreter exit
+    atexit.register(_persist_ws_registry_now)
 
     def _ws_project_name(ws: dict) -> str:
         """Project name for storage (includes ws_id for uniqueness)."""
@@ -285,28 +717,22 @@ def create_app(config_path: str, db_path: str = None,
 
     def _find_checker_by_name(name: str, ws_id: str = None) -> Optional[BaseChecker]:
         """Find a checker by name from the workspace's checker list."""
-        for c in _get_checkers(ws_id):
-            if c.name == name:
-                return c
-        return None
+        return _get_checker_map(ws_id).get(name)
 
     # ── Routes ──────────────────────────────────────────
 
     @app.route("/")
     def index():
-        ws = _get_ws()
-        checkers = _get_checkers()
-        meta = [c.get_meta() for c in checkers]
+        # Resolve the workspace cookie once for the whole page
+        current_id = _current_ws_id()
+        ws = app.config["WORKSPACES"][current_id]
+        meta = [c.get_meta() for c in _get_checkers(current_id)]
 
         # Build workspace list for template
-        ws_list = []
-        current_id = _current_ws_id()
-        for wid, w in app.config["WORKSPACES"].items():
-            ws_list.append({
-                "id": wid,
-                "name": w["name"],
-                "is_current": wid == current_id,
-            })
+        ws_list = [
+            {"id": w["id"], "name": w["name"], "is_current": w["id"] == current_id}
+            for w in _ws_list_base()
+        ]
 
         # Agent status for template
         agent_loop = app.config.get("AGENT_LOOPS", {}).get(current_id)
@@ -330,14 +756,10 @@ def create_app(config_path: str, db_path: str = None,
         """List all workspaces and current selection."""
         current_id = _current_ws_id()
         connectors = app.config.get("MONITOR_CONNECTORS", {})
-        ws_list = []
-        for wid, w in app.config["WORKSPACES"].items():
-            ws_list.append({
-                "id": wid,
-                "name": w["name"],
-                "root": str(w["project_root"]),
-                "monitor_enabled": wid in connectors,
-            })
+        ws_list = [
+            {**w, "monitor_enabled": w["id"] in connectors}
+            for w in _ws_list_base()
+        ]
         return jsonify({"success": True, "current": current_id, "workspaces": ws_list})
 
     @app.route("/api/workspace/switch", methods=["POST"])
@@ -383,22 +805,27 @@ def create_app(config_path: str, db_path: str = None,
 
         dirs = []
         try:
-            for entry in sorted(target.iterdir()):
-                if not entry.is_dir():
-                    continue
-                name = entry.name
-                # Skip hidden dirs (except a few useful ones)
-                if name.startswith(".") and name not in (".debugger",):
-                    continue
-                # Detect if this looks like a project (has code/config files)
-                is_project = any((entry / marker).exists() for marker in [
-                    "app.py", "main.py", "manage.py", "setup.py", "pyproject.toml",
-                    "package.json", "Cargo.toml", "go.mod", "Makefile",
-                    "requirements.txt", ".git", ".debugger",
-                ])
+            # scandir: is_dir() answers from the directory entry's d_type
+            # (a stat only for symlinks), unlike Path.iterdir() + is_dir()
+            with os.scandir(target) as it:
+                entries = [
+                    e for e in it
+                    # Skip hidden dirs (except a few useful ones)
+                    if (not e.name.startswith(".") or e.name in (".debugger",))
+                    and e.is_dir()
+                ]
+            entries.sort(key=lambda e: e.name)
+            for entry in entries:
+                # Detect if this looks like a project (has code/config files):
+                # one listing of the subdir instead of a stat per marker
+                try:
+                    with os.scandir(entry.path) as sub:
+                        is_project = not _PROJECT_MARKERS.isdisjoint(e.name for e in sub)
+                except OSError:
+                    is_project = False
                 dirs.append({
-                    "name": name,
-                    "path": str(entry),
+                    "name": entry.name,
+                    "path": entry.path,
                     "is_project": is_project,
                 })
         except PermissionError:
@@ -447,6 +874,7 @@ def create_app(config_path: str, db_path: str = None,
                 return jsonify({"success": False, "error": f"Failed to initialize: {raw_path}"}), 500
 
         # Check if already loaded
+        config_path = config_path.resolve()
         ws_id = _make_ws_id(config_path)
         if ws_id in app.config["WORKSPACES"]:
             ws = app.config["WORKSPACES"][ws_id]
@@ -459,16 +887,10 @@ def create_app(config_path: str, db_path: str = None,
         try:
             ws = _load_workspace(config_path, defaults)
             app.config["WORKSPACES"][ws["id"]] = ws
+            _invalidate_ws_cache()
 
             # ── Persist to workspaces.json ──
-            try:
-                _save_workspace_registry(
-                    config_path=Path(app.config["_PRIMARY_CONFIG_PATH"]),
-                    workspaces=app.config["WORKSPACES"],
-                    default_ws_id=app.config["DEFAULT_WORKSPACE"],
-                )
-            except Exception as pe:
-                print(f"[workspace] ⚠ Persist failed: {pe}")
+            _schedule_ws_registry_persist()
 
             # ── Initialize monitor connector if workspace has monitor config ──
             _maybe_init_monitor_for_ws(app, ws)
@@ -494,8 +916,11 @@ def create_app(config_path: str, db_path: str = None,
             return jsonify({"success": False, "error": "Cannot remove the primary workspace"}), 400
 
         ws = app.config["WORKSPACES"].pop(ws_id)
+        _invalidate_ws_cache()
         # Also remove cached registry
         app.config["REGISTRIES"].pop(ws_id, None)
+        app.config["LAST_SCAN"].pop(ws_id, None)
+        app.config["LLM_PROVIDERS"].pop(ws_id, None)
         # Stop and remove monitor connector for this workspace
         connectors = app.config.get("MONITOR_CONNECTORS", {})
         if ws_id in connectors:
@@ -506,14 +931,7 @@ def create_app(config_path: str, db_path: str = None,
             del connectors[ws_id]
 
         # ── Persist removal to workspaces.json ──
-        try:
-            _save_workspace_registry(
-                config_path=Path(app.config["_PRIMARY_CONFIG_PATH"]),
-                workspaces=app.config["WORKSPACES"],
-                default_ws_id=app.config["DEFAULT_WORKSPACE"],
-            )
-        except Exception:
-            pass
+        _schedule_ws_registry_persist()
 
         print(f"[workspace] ✗ Removed: {ws['name']} [{ws_id}]")
         return jsonify({"success": True, "removed": ws_id, "name": ws["name"]})
@@ -532,41 +950,51 @@ def create_app(config_path: str, db_path: str = None,
             # Send plugin load errors first (if any)
             load_errors = ws.get("_load_errors", [])
             if load_errors:
-                yield f"data: {json.dumps({'type': 'plugin_errors', 'errors': load_errors}, ensure_ascii=False)}\n\n"
+                yield _sse({"type": "plugin_errors", "errors": load_errors})
 
-            start = time.time()
+            start = time.perf_counter_ns()
             all_reports = []
+            ok_reports = []  # all_reports minus crashed checkers (for _remember_scan)
             total_pass = total_warn = total_fail = 0
 
             for checker in checkers:
-                yield f"data: {json.dumps({'type': 'phase_start', 'name': checker.name, 'display': checker.display_name}, ensure_ascii=False)}\n\n"
+                yield _sse({"type": "phase_start", "name": checker.name, "display": checker.display_name})
 
-                t0 = time.time()
+                t0 = time.perf_counter_ns()
+                crashed = False
                 try:
                     report = checker.run(p_root, cfg)
                 except Exception as e:
+                    crashed = True
                     report = PhaseReport(checker.name)
                     report.add(CheckResult("error", CheckResult.FAIL, str(e)))
-                report.duration_ms = int((time.time() - t0) * 1000)
+                report.duration_ms = (time.perf_counter_ns() - t0) // 1_000_000
 
                 rd = report.to_dict()
                 rd["meta"] = checker.get_meta()
                 all_reports.append(rd)
-                total_pass += report.pass_count
-                total_warn += report.warn_count
-                total_fail += report.fail_count
+                if not crashed:
+                    ok_reports.append(rd)
+                total_pass += rd["pass_count"]
+                total_warn += rd["warn_count"]
+                total_fail += rd["fail_count"]
 
-                yield f"data: {json.dumps({'type': 'phase_done', 'name': checker.name, 'report': rd}, ensure_ascii=False)}\n\n"
+                yield _sse({"type": "phase_done", "name": checker.name, "report": rd})
 
-            elapsed = int((time.time() - start) * 1000)
+            elapsed = (time.perf_counter_ns() - start) // 1_000_000
             total_active = total_pass + total_warn + total_fail
             health_pct = (total_pass / total_active * 100) if total_active else 100
             overall = "CRITICAL" if total_fail > 0 else ("DEGRADED" if total_warn > 0 else "HEALTHY")
 
             storage.save_scan(project_name, overall, total_pass, total_warn, total_fail,
                               health_pct, all_reports, elapsed)
+            _remember_scan(ws_id, ok_reports)
 
-            yield f"data: {json.dumps({'type': 'scan_complete', 'overall': overall, 'total_pass': total_pass, 'total_warn': total_warn, 'total_fail': total_fail, 'health_pct': round(health_pct, 1), 'duration_ms': elapsed}, ensure_ascii=False)}\n\n"
+            yield _sse({
+                "type": "scan_complete", "overall": overall,
+                "total_pass": total_pass, "total_warn": total_warn, "total_fail": total_fail,
+                "health_pct": round(health_pct, 1), "duration_ms": elapsed,
+            })
 
         return Response(generate(), mimetype="text/event-stream",
                         headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
@@ -597,9 +1025,9 @@ def create_app(config_path: str, db_path: str = None,
         if not checker:
             return jsonify({"success": False, "error": f"Phase '{name}' not found"}), 404
         try:
-            t0 = time.time()
+            t0 = time.perf_counter_ns()
             report = checker.run(p_root, cfg)
-            report.duration_ms = int((time.time() - t0) * 1000)
+            report.duration_ms = (time.perf_counter_ns() - t0) // 1_000_000
             rd = report.to_dict()
             rd["meta"] = checker.get_meta()
             return jsonify({"success": True, "data": rd})
@@ -631,21 +1059,6 @@ def create_app(config_path: str, db_path: str = None,
     # In-memory API key store — never persisted to disk
     _api_keys = {}  # workspace_id → api_key_value
 
-    # Provider prefix → env var name mapping
-    _PROVIDER_ENV_MAP = {
-        "anthropic/": "ANTHROPIC_API_KEY",
-        "openai/":    "OPENAI_API_KEY",
-        "gemini/":    "GEMINI_API_KEY",
-        "deepseek/":  "DEEPSEEK_API_KEY",
-    }
-
-    def _env_var_for_model(model: str) -> str:
-        """Return the conventional env var name for a model string."""
-        for prefix, env_var in _PROVIDER_ENV_MAP.items():
-            if model.startswith(prefix):
-                return env_var
-        return ""
-
     @app.route("/api/config/llm", methods=["GET", "POST"])
     def config_llm():
         """GET: return current LLM config + key status.
@@ -800,8 +1213,8 @@ def create_app(config_path: str, db_path: str = None,
             config_path = ws.get("config_path")
             if config_path and config_path.exists():
                 try:
-                    with open(config_path, encoding="utf-8") as f:
-                        file_cfg = yaml.safe_load(f) or {}
+                    # Cached parse (deep copy) — safe to modify before writing back
+                    file_cfg = _load_yaml_cached(config_path)
                     if "llm" not in file_cfg:
                         file_cfg["llm"] = {}
                     # Only persist safe fields (no api_key, no api_key_env)
@@ -809,7 +1222,8 @@ def create_app(config_path: str, db_path: str = None,
                                     if k not in ("api_key", "api_key_env")}
                     file_cfg["llm"].update(safe_updates)
                     with open(config_path, "w", encoding="utf-8") as f:
-                        yaml.dump(file_cfg, f, default_flow_style=False, allow_unicode=True)
+                        yaml.dump(file_cfg, f, Dumper=_YAMLDumper,
+                                  default_flow_style=False, allow_unicode=True)
                 except Exception as e:
                     return jsonify({
                         "success": True,
@@ -823,8 +1237,9 @@ def create_app(config_path: str, db_path: str = None,
         if agent_loop and hasattr(agent_loop, 'executor'):
             if model:
                 try:
-                    from .llm.provider import LLMProvider
-                    new_provider = LLMProvider(ws["config"])
+                    if LLMProvider is None:
+                        raise ImportError("LLM provider module unavailable")
+                    new_provider = _llm_provider_for(ws_id, ws["config"])
                     if new_provider.is_available:
                         agent_loop.executor._llm = new_provider
                         llm_status = f"active:{new_provider.model_name}"
@@ -883,20 +1298,33 @@ def create_app(config_path: str, db_path: str = None,
         total_warn = 0
         total_fail = 0
 
+        # Reuse a fresh scan when there is one; otherwise run the checkers
+        reports = _recent_scan_reports(ws_id)
+        if reports is None:
+            reports = []
+            results = _run_checkers_concurrently(checkers, project_root, config)
+            for checker, (report, error, _) in zip(checkers, results):
+                if error is not None:
+                    continue
+                try:
+                    rd = report.to_dict()
+                except Exception:
+                    continue
+                rd["meta"] = checker.get_meta()
+                reports.append(rd)
+
         all_phases = []  # for healthy phases summary
-        for checker in checkers:
+        for rd in reports:
             try:
-                report = checker.run(project_root, config)
-                rd = report.to_dict()
                 checks = rd.get("checks", [])
-                p = sum(1 for c in checks if c["status"] == "PASS")
-                w = sum(1 for c in checks if c["status"] == "WARN")
-                f = sum(1 for c in checks if c["status"] == "FAIL")
+                p = rd["pass_count"]
+                w = rd["warn_count"]
+                f = rd["fail_count"]
                 total_pass += p
                 total_warn += w
                 total_fail += f
                 display = (rd.get("meta", {}).get("display_name")
-                           or checker.name)
+                           or rd["name"])
 
                 if w > 0 or f > 0:
                     # Include detailed evidence for failing checks
@@ -910,11 +1338,7 @@ def create_app(config_path: str, db_path: str = None,
                             }
                             # Include details (evidence) — truncate large ones
                             if c.get("details"):
-                                import json as _json
-                                det_str = _json.dumps(c["details"], default=str)
-                                if len(det_str) > 500:
-                                    det_str = det_str[:500] + "..."
-                                entry["details"] = det_str
+                                entry["details"] = _truncate_json(c["details"], 500)
                             if c.get("fix_desc"):
                                 entry["fix_desc"] = c["fix_desc"]
                             if c.get("fixable"):
@@ -941,10 +1365,10 @@ def create_app(config_path: str, db_path: str = None,
         }
 
         try:
-            report_text = llm.generate_report(scan_summary)
-            from .llm.prompts import parse_analysis_response
+            # Bounded: provider timeout/max_tokens, one retry on transient errors
+            report_text = llm.generate_report(scan_summary, max_retries=1)
             parsed = parse_analysis_response(report_text)
-            return jsonify({
+            return _json_response({
                 "success": True,
                 "overview": report_text,
                 "root_causes": parsed.get("root_causes", []),
@@ -953,6 +1377,8 @@ def create_app(config_path: str, db_path: str = None,
                 "cost_usd": 0,  # tracked internally by cost tracker
                 "totals": scan_summary["totals"],
             })
+        except TimeoutError as e:
+            return jsonify({"success": False, "error": "llm_timeout", "detail": str(e)})
         except Exception as e:
             return jsonify({"success": False, "error": str(e)})
 
@@ -968,162 +1394,43 @@ def create_app(config_path: str, db_path: str = None,
         p_root = ws["project_root"]
         project_name = cfg.get("project", {}).get("name", "Unknown")
         ws_root = cfg.get("project", {}).get("root", str(p_root))
-        checkers = _get_checkers(_current_ws_id())
+        ws_id = _current_ws_id()
+        checkers = _get_checkers(ws_id)
 
         # Run all checkers
-        start = time.time()
+        start = time.perf_counter_ns()
         all_reports = []
+        ok_reports = []  # all_reports minus crashed checkers (for _remember_scan)
         total_pass = total_warn = total_fail = total_skip = 0
 
-        for checker in checkers:
-            t0 = time.time()
-            try:
-                report = checker.run(p_root, cfg)
-            except Exception as e:
+        results = _run_checkers_concurrently(checkers, p_root, cfg)
+        for checker, (report, error, duration_ms) in zip(checkers, results):
+            if error is not None:
                 report = PhaseReport(checker.name)
-                report.add(CheckResult("error", CheckResult.FAIL, str(e)))
-            report.duration_ms = int((time.time() - t0) * 1000)
+                report.add(CheckResult("error", CheckResult.FAIL, str(error)))
+            report.duration_ms = duration_ms
             rd = report.to_dict()
             rd["meta"] = checker.get_meta()
             all_reports.append(rd)
-            total_pass += report.pass_count
-            total_warn += report.warn_count
-            total_fail += report.fail_count
-            total_skip += report.skip_count
-
-        elapsed = int((time.time() - start) * 1000)
+            if error is None:
+                ok_reports.append(rd)
+            total_pass += rd["pass_count"]
+            total_warn += rd["warn_count"]
+            total_fail += rd["fail_count"]
+            total_skip += rd["skip_count"]
+        _remember_scan(ws_id, ok_reports)
+
+        elapsed = (time.perf_counter_ns() - start) // 1_000_000
         total_active = total_pass + total_warn + total_fail
         health_pct = (total_pass / total_active * 100) if total_active else 100
         overall = "CRITICAL" if total_fail > 0 else ("DEGRADED" if total_warn > 0 else "HEALTHY")
 
-        # Build Markdown report
         now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        status_emoji = {"CRITICAL": "🔴", "DEGRADED": "🟡", "HEALTHY": "🟢"}.get(overall, "⚪")
-
-        lines = [
-            f"# 🏥 System Diagnostics Report",
-            f"",
-            f"> **Project**: {project_name}",
-            f"> **Root**: `{ws_root}`",
-            f"> **Generated**: {now}",
-            f"> **Duration**: {elapsed}ms",
-            f"",
-            f"## {status_emoji} Overall Status: **{overall}**",
-            f"",
-            f"| Metric | Count |",
-            f"|--------|-------|",
-            f"| ✅ PASS | {total_pass} |",
-            f"| ⚠️ WARN | {total_warn} |",
-            f"| ❌ FAIL | {total_fail} |",
-            f"| ⏭️ SKIP | {total_skip} |",
-            f"| **Health** | **{health_pct:.1f}%** |",
-            f"",
-            f"---",
-            f"",
-        ]
-
-        for r in all_reports:
-            meta = r.get("meta", {})
-            icon = meta.get("icon", "")
-            display = meta.get("display_name", r.get("name", "?"))
-            checks = r.get("checks", [])
-            pc = r.get("pass_count", 0)
-            wc = r.get("warn_count", 0)
-            fc = r.get("fail_count", 0)
-            sc = r.get("skip_count", 0)
-            duration = r.get("duration_ms", 0)
-
-            if fc > 0:
-                phase_status = "🔴 FAIL"
-            elif wc > 0:
-                phase_status = "🟡 WARN"
-            elif sc == len(checks):
-                phase_status = "⚪ SKIP"
-            else:
-                phase_status = "🟢 PASS"
-
-            lines.append(f"## {icon} {display}  —  {phase_status}")
-            lines.append(f"")
-
-            if meta.get("tooltip_why"):
-                lines.append(f"> {meta['tooltip_why']}")
-                lines.append(f"")
-
-            lines.append(f"| Status | Check | Message |")
-            lines.append(f"|--------|-------|---------|")
-
-            for c in checks:
-                st = c.get("status", "?")
-                sym = {"PASS": "✅", "WARN": "⚠️", "FAIL": "❌", "SKIP": "⏭️"}.get(st, "?")
-                name = c.get("name", "?")
-                msg = c.get("message", "").replace("|", "\\|")
-                lines.append(f"| {sym} {st} | `{name}` | {msg} |")
-
-            lines.append(f"")
-
-            # Details section for non-PASS checks
-            detail_checks = [c for c in checks if c.get("status") in ("WARN", "FAIL") and c.get("details")]
-            if detail_checks:
-                lines.append(f"<details>")
-                lines.append(f"<summary>📋 Details ({len(detail_checks)} items)</summary>")
-                lines.append(f"")
-                for c in detail_checks:
-                    lines.append(f"**{c['name']}**:")
-                    d = c.get("details")
-                    if isinstance(d, list):
-                        for item in d[:10]:
-                            if isinstance(item, dict):
-                                parts = []
-                                for k, v in item.items():
-                                    parts.append(f"{k}=`{v}`")
-                                lines.append(f"- {', '.join(parts)}")
-                            else:
-                                lines.append(f"- `{item}`")
-                    elif isinstance(d, dict):
-                        for k, v in list(d.items())[:10]:
-                            if isinstance(v, list):
-                                lines.append(f"- **{k}**: {', '.join(f'`{x}`' for x in v[:10])}")
-                            else:
-                                lines.append(f"- **{k}**: `{v}`")
-                    lines.append(f"")
-
-                    if c.get("fixable"):
-                        lines.append(f"  🔧 **Auto-fix**: {c.get('fix_desc', '')}")
-                        lines.append(f"")
-
-                lines.append(f"</details>")
-                lines.append(f"")
-
-            lines.append(f"---")
-            lines.append(f"")
-
-        # Action items summary
-        action_items = []
-        for r in all_reports:
-            for c in r.get("checks", []):
-                if c.get("status") == "FAIL":
-                    phase_name = r.get("meta", {}).get("display_name", r.get("name", "?"))
-                    action_items.append(f"❌ **{phase_name}** → `{c['name']}`: {c.get('message', '')}")
-                elif c.get("status") == "WARN" and c.get("fixable"):
-                    phase_name = r.get("meta", {}).get("display_name", r.get("name", "?"))
-                    action_items.append(f"🔧 **{phase_name}** → `{c['name']}`: {c.get('fix_desc', '')}")
-
-        if action_items:
-            lines.append(f"## 🎯 Action Items")
-            lines.append(f"")
-            for i, item in enumerate(action_items, 1):
-                lines.append(f"{i}. {item}")
-            lines.append(f"")
-
-        lines.append(f"---")
-        lines.append(f"*Generated by Debug Dashboard Core • {now}*")
-
-        content = "\n".join(lines)
 
         # Return as downloadable file
         fmt = request.args.get("format", "md")
         if fmt == "json":
-            return jsonify({
+            return _json_response({
                 "success": True,
                 "report": {
                     "project": project_name,
@@ -1141,10 +1448,15 @@ def create_app(config_path: str, db_path: str = None,
         date_str = datetime.datetime.now().strftime("%Y%m%d_%H%M")
         filename = f"diagnostic_report_{safe_name}_{date_str}.md"
 
-        resp = make_response(content)
-        resp.headers["Content-Type"] = "text/markdown; charset=utf-8"
-        resp.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
-        return resp
+        # Streamed section by section — the full report is never held in memory
+        body = _iter_markdown_report(
+            all_reports, project_name=project_name, ws_root=ws_root, now=now,
+            elapsed=elapsed, overall=overall, health_pct=health_pct,
+            totals=(total_pass, total_warn, total_fail, total_skip),
+        )
+        return Response(body, content_type="text/markdown; charset=utf-8", headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+        })
 
     # ── Agent integration (conditional, per-workspace) ──────────────
     # Each workspace can independently enable agent mode via agent.enabled: true.
@@ -1152,11 +1464,13 @@ def create_app(config_path: str, db_path: str = None,
     app.config["AGENT_LOOPS"] = {}  # ws_id → AgentLoop
     _any_agent_enabled = False
 
-    for ws_id, ws in workspaces.items():
-        ws_agent_enabled = ws["config"].get("agent", {}).get("enabled", False)
-        if not ws_agent_enabled:
-            continue
-
+    agent_workspaces = [
+        (ws_id, ws) for ws_id, ws in workspaces.items()
+        if ws["config"].get("agent", {}).get("enabled", False)
+    ]
+    # Agent modules are imported once, and only if some workspace enables it
+    _agent_available = False
+    if agent_workspaces:
         try:
             from .agent.loop import AgentLoop
             from .agent.observer import FileObserver
@@ -1165,18 +1479,29 @@ def create_app(config_path: str, db_path: str = None,
             from .agent.graph import CheckerDependencyGraph
             from .agent.memory import AgentMemory
             from .agent_routes import agent_bp, init_agent_blueprint
+            _agent_available = True
+        except ImportError as e:
+            print(f"[agent] ⚠ Agent dependencies missing: {e}")
+
+    # Graphs are read-only once built, so workspaces whose checkers declare the
+    # same dependencies share one (and its resolved-order caches)
+    dep_graphs: Dict[tuple, Any] = {}  # declared deps → CheckerDependencyGraph
 
+    for ws_id, ws in (agent_workspaces if _agent_available else ()):
+        try:
             # Initialize agent for this workspace
+            # Reuses the memoized registry entry (instances + name map)
             ws_checkers = _get_checkers(ws_id)
-            checker_dict = {c.name: c for c in ws_checkers}
-            checker_names = [c.name for c in ws_checkers]
+            checker_dict = _get_checker_map(ws_id)
+            checker_names = list(checker_dict)
 
             # Optional LLM provider
             llm_provider = None
             if ws["config"].get("llm", {}).get("model"):
                 try:
-                    from .llm.provider import LLMProvider
-                    llm_provider = LLMProvider(ws["config"])
+                    if LLMProvider is None:
+                        raise ImportError("LLM provider module unavailable")
+                    llm_provider = _llm_provider_for(ws_id, ws["config"])
                     if llm_provider.is_available:
                         print(f"[agent:{ws_id[:6]}] LLM: {llm_provider.model_name}")
                     else:
@@ -1186,17 +1511,25 @@ def create_app(config_path: str, db_path: str = None,
                     print(f"[agent:{ws_id[:6]}] LLM init failed: {e} (Tier 1 only)")
 
             # Build dependency graph (merge defaults + checker-declared deps)
-            dep_graph = CheckerDependencyGraph()
-            for c in ws_checkers:
-                if hasattr(c, 'depends_on') and c.depends_on:
-                    dep_graph.add_from_checker(c.name, c.depends_on)
+            declared = tuple(
+                (c.name, tuple(c.depends_on)) for c in ws_checkers
+                if getattr(c, 'depends_on', None)
+            )
+            dep_graph = dep_graphs.get(declared)
+            if dep_graph is None:
+                dep_graph = CheckerDependencyGraph()
+                for name, deps in declared:
+                    dep_graph.add_from_checker(name, deps)
+                dep_graphs[declared] = dep_graph
 
             memory = AgentMemory(workspace_id=ws_id)
             observer = FileObserver(ws["project_root"], ws["config"])
             reasoner = Reasoner(ws["config"], checker_names)
+            agent_cfg = ws["config"].get("agent", {})
             executor = Executor(
                 checker_dict, ws["project_root"], ws["config"],
-                dep_graph, llm_provider, workspace_id=ws_id
+                dep_graph, llm_provider, workspace_id=ws_id,
+                llm_timeout_seconds=agent_cfg.get("llm_timeout_seconds", 90),
             )
 
             agent_loop = AgentLoop(
@@ -454,8 +454,10 @@ class SSEProxyClient:
                     q.put_nowait(event)
                 except Full:
                     dead_clients.append(q)
-            for q in dead_clients:
-                self._client_queues.remove(q)
+            if dead_clients:
+                # One O(N) filter instead of an O(N) list.remove per dead client
+                dead_set = set(dead_clients)
+                self._client_queues = [q for q in self._client_queues if q not in dead_set]
 
         # Relay to external callback (ActiveProcessingDetector)
         if self._on_event:
@@ -589,8 +591,9 @@ class ActiveProcessingDetector:
                     q.put_nowait(event)
                 except Full:
                     dead.append(q)
-            for q in dead:
-                self._client_queues.remove(q)
+            if dead:
+                dead_set = set(dead)
+                self._client_queues = [q for q in self._client_queues if q not in dead_set]
 
     def receive_callback(self, data: dict):
         """메인 서비스에서 HTTP 콜백으로 수신한 이벤트 처리."""
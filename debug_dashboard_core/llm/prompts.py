@@ -6,7 +6,13 @@ GPT Risk #5 addressed: prompts include rich evidence context
 import json
 import platform
 import sys
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional
+
+# Coarse prompt-size estimate used for budgeting (no tokenizer dependency)
+_CHARS_PER_TOKEN = 4
+
+# Input budget for the full-scan overview prompt
+REPORT_PROMPT_MAX_TOKENS = 16000
 
 
 def build_analysis_prompt(checker_name: str, report: dict, config: dict,
@@ -94,8 +100,56 @@ def build_analysis_prompt(checker_name: str, report: dict, config: dict,
     return prompt
 
 
-def build_report_prompt(scan_data: dict) -> str:
-    """Generate a comprehensive Korean overview from scan data."""
+def build_report_prompt(scan_data: dict, max_tokens: Optional[int] = None) -> str:
+    """Generate a comprehensive Korean overview from scan data.
+
+    With max_tokens, issues are trimmed step by step (see _REPORT_SHRINK_STEPS)
+    until the estimated prompt size fits; omitted counts are noted per phase.
+    """
+    prompt = _render_report_prompt(scan_data)
+    if max_tokens is None:
+        return prompt
+    for shrink in _REPORT_SHRINK_STEPS:
+        if len(prompt) // _CHARS_PER_TOKEN <= max_tokens:
+            break
+        scan_data = _shrink_issues(scan_data, shrink)
+        prompt = _render_report_prompt(scan_data)
+    return prompt
+
+
+def _shrink_issues(scan_data: dict, shrink: Callable[[List[dict]], List[dict]]) -> dict:
+    """Copy of scan_data with shrink() applied to every phase's issue list."""
+    phases = {}
+    for name, phase_data in scan_data.get("phases", {}).items():
+        issues = phase_data.get("issues", [])
+        kept = shrink(issues)
+        phases[name] = {
+            **phase_data,
+            "issues": kept,
+            "omitted": phase_data.get("omitted", 0) + len(issues) - len(kept),
+        }
+    return {**scan_data, "phases": phases}
+
+
+def _without_details(issue: dict) -> dict:
+    return {k: v for k, v in issue.items() if k != "details"}
+
+
+# Least informative first: shorter evidence, then WARNs, then no evidence,
+# then only the first few FAILs per phase
+_REPORT_SHRINK_STEPS = (
+    lambda issues: [
+        {**i, "details": i["details"][:150] + "..."}
+        if isinstance(i.get("details"), str) and len(i["details"]) > 150 else i
+        for i in issues
+    ],
+    lambda issues: [i for i in issues if i["status"] == "FAIL"],
+    lambda issues: [_without_details(i) for i in issues],
+    lambda issues: issues[:3],
+)
+
+
+def _render_report_prompt(scan_data: dict) -> str:
     totals = scan_data.get("totals", {})
     phases = scan_data.get("phases", {})
     healthy = scan_data.get("healthy_phases", [])
@@ -126,6 +180,8 @@ def build_report_prompt(scan_data: dict) -> str:
                 prompt += f"  증거: {issue['details']}\n"
             if issue.get("fix_desc"):
                 prompt += f"  자동수정 가능: {issue['fix_desc']}\n"
+        if phase_data.get("omitted"):
+            prompt += f"- … 프롬프트 길이 제한으로 이슈 {phase_data['omitted']}개 생략\n"
 
     prompt += """
 ## 분석 요청 (각 항목을 **충분히 상세하게** 작성하세요)
@@ -15,7 +15,9 @@ import time
 from typing import Optional
 
 from ..agent.events import LLMAnalysis
-from .prompts import build_analysis_prompt, build_report_prompt, parse_analysis_response
+from .prompts import (
+    REPORT_PROMPT_MAX_TOKENS, build_analysis_prompt, build_report_prompt, parse_analysis_response,
+)
 from .cost import CostTracker
 
 logger = logging.getLogger("llm.provider")
@@ -174,19 +176,29 @@ class LLMProvider:
             },
         )
 
-    def generate_report(self, scan_data: dict) -> str:
-        """Generate natural language report from scan data."""
+    def generate_report(self, scan_data: dict, timeout: Optional[float] = None,
+                        max_retries: int = 0, max_tokens: Optional[int] = None) -> str:
+        """Generate natural language report from scan data.
+
+        Defaults: timeout max(timeout_seconds, 60), max_tokens max(max_tokens, 4000)
+        — an overview is longer than a single-checker analysis. Raises
+        TimeoutError if the provider times out (after any retries).
+        """
         self._ensure_litellm()
-        prompt = build_report_prompt(scan_data)
-        # Use higher max_tokens for comprehensive overview
-        overview_max = max(self._max_tokens, 4000)
-        response = self._litellm.completion(
-            model=self._model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.4,
-            max_tokens=overview_max,
-            timeout=max(self._timeout, 60),
-        )
+        prompt = build_report_prompt(scan_data, max_tokens=REPORT_PROMPT_MAX_TOKENS)
+        try:
+            response = self._litellm.completion(
+                model=self._model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.4,
+                max_tokens=max_tokens or max(self._max_tokens, 4000),
+                timeout=timeout or max(self._timeout, 60),
+                num_retries=max_retries,
+            )
+        except Exception as e:
+            if isinstance(e, getattr(self._litellm, "Timeout", ())):
+                raise TimeoutError(f"LLM report timed out ({self._model})") from e
+            raise
         try:
             cost = self._litellm.completion_cost(completion_response=response)
         except Exception:
@@ -17,9 +17,10 @@ Evidence standard (recommended keys for CheckResult.details):
     }
 """
 
+import hashlib
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 
 class CheckResult:
@@ -86,19 +87,65 @@ class PhaseReport:
         return (self.pass_count / total) * 100
 
     def to_dict(self) -> dict:
+        # One pass over checks builds both the counts and the check dicts
+        # (the count properties would each rescan the list)
+        counts = {CheckResult.PASS: 0, CheckResult.FAIL: 0, CheckResult.WARN: 0, CheckResult.SKIP: 0}
+        checks = []
+        for c in self.checks:
+            if c.status in counts:
+                counts[c.status] += 1
+            checks.append(c.to_dict())
+        skip = counts[CheckResult.SKIP]
+        total_active = len(checks) - skip
+        health_pct = (counts[CheckResult.PASS] / total_active * 100) if total_active else 100.0
         return {
             "name": self.name,
-            "pass_count": self.pass_count,
-            "fail_count": self.fail_count,
-            "warn_count": self.warn_count,
-            "skip_count": self.skip_count,
-            "total_active": self.total_active,
-            "health_pct": round(self.health_pct, 1),
+            "pass_count": counts[CheckResult.PASS],
+            "fail_count": counts[CheckResult.FAIL],
+            "warn_count": counts[CheckResult.WARN],
+            "skip_count": skip,
+            "total_active": total_active,
+            "health_pct": round(health_pct, 1),
             "duration_ms": self.duration_ms,
-            "checks": [c.to_dict() for c in self.checks],
+            "checks": checks,
         }
 
 
+def files_fingerprint(paths: Iterable[Path]) -> str:
+    """Cheap input fingerprint from each file's (path, mtime_ns, size).
+
+    Missing files contribute a fixed marker, so creating or deleting a
+    file also changes the fingerprint. Intended for input_fingerprint().
+    """
+    h = hashlib.blake2b(digest_size=8)
+    for p in paths:
+        try:
+            st = p.stat()
+            h.update(f"{p}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+        except OSError:
+            h.update(f"{p}\0-\n".encode())
+    return h.hexdigest()
+
+
+def iter_scan_files(project_root: Path, scan_dirs: Iterable[str], pattern: str = "*.py",
+                    skip_dirs: Iterable[str] = ()) -> Iterator[Path]:
+    """Files matching `pattern` under each scan dir, as the file-based checkers walk them.
+
+    Paths with a hidden component or a component in skip_dirs are left out.
+    Meant for input_fingerprint(): pass the same scan_dirs/skip_dirs as run().
+    """
+    skip = frozenset(skip_dirs)
+    for scan_dir in scan_dirs:
+        base = project_root / scan_dir.rstrip("/")
+        if not base.exists():
+            continue
+        for path in base.rglob(pattern):
+            parts = path.relative_to(project_root).parts
+            if any(p.startswith(".") or p in skip for p in parts):
+                continue
+            yield path
+
+
 class BaseChecker(ABC):
     """Base class for all checkers (both builtin and plugin).
 
@@ -107,6 +154,7 @@ class BaseChecker(ABC):
         - display_name: shown in UI cards
         - run(): Inspector — READ-only diagnosis, returns PhaseReport
         - fix(): Fixer — SAFE_FIX level only (TODO markers, config edits, cache clear)
+        - input_fingerprint(): optional — enables result caching in agent scans
     """
     name: str = ""
     display_name: str = ""
@@ -117,6 +165,7 @@ class BaseChecker(ABC):
     icon: str = ""
     color: str = "#6366f1"
     depends_on: List[str] = []   # names of checkers that must run before this one
+    meta_is_stable: bool = True  # get_meta() built once per instance; False = rebuild each call
 
     def is_applicable(self, config: dict) -> bool:
         checks = config.get("checks", {})
@@ -128,13 +177,27 @@ class BaseChecker(ABC):
         """Inspector: diagnose project state (READ-only)."""
         pass
 
+    def input_fingerprint(self, project_root: Path, config: dict) -> Optional[str]:
+        """Fingerprint of everything run() reads (e.g. files_fingerprint(...)).
+
+        While the fingerprint and workspace config are unchanged, the agent
+        executor reuses the previous report instead of calling run() again.
+        Default None disables caching — run() always executes.
+        """
+        return None
+
     def fix(self, check_name: str, project_root: Path, config: dict) -> dict:
         """Fixer: auto-fix a specific check (SAFE_FIX level).
         Returns {success: bool, message: str}."""
         return {"success": False, "message": "No auto-fix available for this check"}
 
     def get_meta(self) -> dict:
-        return {
+        """UI metadata. Cached per instance while meta_is_stable — treat as read-only."""
+        if self.meta_is_stable:
+            meta = self.__dict__.get("_cached_meta")
+            if meta is not None:
+                return meta
+        meta = {
             "name": self.name,
             "display_name": self.display_name,
             "description": self.description,
@@ -144,3 +207,6 @@ class BaseChecker(ABC):
             "icon": self.icon,
             "color": self.color,
         }
+        if self.meta_is_stable:
+            self._cached_meta = meta
+        return meta
@@ -9,7 +9,9 @@ Checks:
 import re
 from pathlib import Path
 
-from ..base import BaseChecker, CheckResult, PhaseReport
+from ..base import BaseChecker, CheckResult, PhaseReport, files_fingerprint, iter_scan_files
+
+_SKIP_DIRS = ("__pycache__", "venv", ".venv", "node_modules")
 
 
 class APIHealthChecker(BaseChecker):
@@ -22,6 +24,14 @@ class APIHealthChecker(BaseChecker):
     icon = "🌐"
     color = "#3b82f6"
 
+    def input_fingerprint(self, project_root: Path, config: dict):
+        phase_cfg = config.get("checks", {}).get(self.name, {})
+        scan_dirs = phase_cfg.get("scan_dirs", ["."])
+        main_file = phase_cfg.get("main_file", "app.py")
+        files = list(iter_scan_files(project_root, scan_dirs, skip_dirs=_SKIP_DIRS))
+        files.append(project_root / main_file)
+        return files_fingerprint(files)
+
     def run(self, project_root: Path, config: dict) -> PhaseReport:
         report = PhaseReport(self.name)
         phase_cfg = config.get("checks", {}).get(self.name, {})
@@ -44,7 +54,7 @@ class APIHealthChecker(BaseChecker):
             for py_file in base.rglob("*.py"):
                 # Skip hidden, venv, pycache
                 parts = py_file.relative_to(project_root).parts
-                if any(p.startswith(".") or p in ("__pycache__", "venv", ".venv", "node_modules") for p in parts):
+                if any(p.startswith(".") or p in _SKIP_DIRS for p in parts):
                     continue
                 try:
                     text = py_file.read_text(encoding="utf-8", errors="ignore")
@@ -9,7 +9,9 @@ Checks:
 import re
 from pathlib import Path
 
-from ..base import BaseChecker, CheckResult, PhaseReport
+from ..base import BaseChecker, CheckResult, PhaseReport, files_fingerprint, iter_scan_files
+
+_SKIP_DIRS = ("__pycache__", "venv", ".venv", "node_modules", "downloads", "chroma_db")
 
 
 class CodeQualityChecker(BaseChecker):
@@ -22,6 +24,11 @@ class CodeQualityChecker(BaseChecker):
     icon = "📐"
     color = "#8b5cf6"
 
+    def input_fingerprint(self, project_root: Path, config: dict):
+        phase_cfg = config.get("checks", {}).get(self.name, {})
+        scan_dirs = phase_cfg.get("scan_dirs", ["."])
+        return files_fingerprint(iter_scan_files(project_root, scan_dirs, skip_dirs=_SKIP_DIRS))
+
     def run(self, project_root: Path, config: dict) -> PhaseReport:
         report = PhaseReport(self.name)
         phase_cfg = config.get("checks", {}).get(self.name, {})
@@ -44,8 +51,7 @@ class CodeQualityChecker(BaseChecker):
                 continue
             for py_file in base.rglob("*.py"):
                 parts = py_file.relative_to(project_root).parts
-                if any(p.startswith(".") or p in ("__pycache__", "venv", ".venv", "node_modules",
-                                                   "downloads", "chroma_db") for p in parts):
+                if any(p.startswith(".") or p in _SKIP_DIRS for p in parts):
                     continue
 
                 try:
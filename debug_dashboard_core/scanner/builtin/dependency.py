@@ -9,7 +9,9 @@ Checks:
 import re
 from pathlib import Path
 
-from ..base import BaseChecker, CheckResult, PhaseReport
+from ..base import BaseChecker, CheckResult, PhaseReport, files_fingerprint, iter_scan_files
+
+_SKIP_DIRS = ("__pycache__", "venv", ".venv")
 
 
 class DependencyChecker(BaseChecker):
@@ -22,6 +24,15 @@ class DependencyChecker(BaseChecker):
     icon = "📦"
     color = "#f59e0b"
 
+    def input_fingerprint(self, project_root: Path, config: dict):
+        phase_cfg = config.get("checks", {}).get(self.name, {})
+        scan_dirs = phase_cfg.get("scan_dirs", ["."])
+        # project_root itself: its mtime moves when a top-level package dir
+        # appears or disappears (run() treats those imports as local)
+        files = [project_root, project_root / "requirements.txt", project_root / "pyproject.toml"]
+        files.extend(iter_scan_files(project_root, scan_dirs, skip_dirs=_SKIP_DIRS))
+        return files_fingerprint(files)
+
     def run(self, project_root: Path, config: dict) -> PhaseReport:
         report = PhaseReport(self.name)
         phase_cfg = config.get("checks", {}).get(self.name, {})
@@ -115,7 +126,7 @@ class DependencyChecker(BaseChecker):
                         continue
                     for py_file in base.rglob("*.py"):
                         parts = py_file.relative_to(project_root).parts
-                        if any(p.startswith(".") or p in ("__pycache__", "venv", ".venv") for p in parts):
+                        if any(p.startswith(".") or p in _SKIP_DIRS for p in parts):
                             continue
                         try:
                             for line in py_file.read_text(encoding="utf-8", errors="ignore").splitlines():
@@ -13,7 +13,7 @@ import importlib.util
 import pkgutil
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .base import BaseChecker
 
@@ -36,6 +36,8 @@ class CheckerRegistry:
         cls._discovered = False
         cls._extra_dirs = []
         cls._load_errors = []
+        cls._builtin_classes = None
+        cls._dir_classes = {}
         # Clean up plugin modules from sys.modules
         to_remove = [k for k in sys.modules if k.startswith("debugger_plugin.")]
         for k in to_remove:
@@ -146,6 +148,13 @@ class CheckerRegistry:
 
     # ── Isolated Discovery (multi-workspace) ──────────
 
+    # Discovered checker *classes*, shared across workspaces; every workspace
+    # still gets its own instances. Plugin modules are cached in sys.modules
+    # after the first exec anyway, so only a directory's file list can change —
+    # its entry is keyed on the directory mtime (files added/removed/renamed).
+    _builtin_classes: Optional[Tuple[List[type], List[dict]]] = None
+    _dir_classes: Dict[str, Tuple[int, List[type], List[dict]]] = {}
+
     @classmethod
     def discover_isolated(cls, extra_dirs: List[str] = None) -> tuple:
         """Discover checkers without mutating global registry state.
@@ -160,6 +169,30 @@ class CheckerRegistry:
         load_errors: List[dict] = []
 
         # 1. Builtin checkers (always the same)
+        classes, errors = cls._discover_builtin_classes()
+        for checker_cls in classes:
+            checkers[checker_cls.name] = checker_cls()
+        load_errors.extend(errors)
+
+        # 2. Extra plugin directories
+        for d_str in (extra_dirs or []):
+            found = cls._discover_dir_classes(Path(d_str))
+            if found is None:
+                continue
+            classes, errors = found
+            for checker_cls in classes:
+                checkers[checker_cls.name] = checker_cls()
+            load_errors.extend(errors)
+
+        return checkers, load_errors
+
+    @classmethod
+    def _discover_builtin_classes(cls) -> Tuple[List[type], List[dict]]:
+        """Checker classes from builtin/ (discovered once per process)."""
+        if cls._builtin_classes is not None:
+            return cls._builtin_classes
+        classes: List[type] = []
+        load_errors: List[dict] = []
         builtin_dir = Path(__file__).parent / "builtin"
         if builtin_dir.exists():
             for _, module_name, _ in pkgutil.iter_modules([str(builtin_dir)]):
@@ -170,44 +203,59 @@ class CheckerRegistry:
                         f".builtin.{module_name}",
                         package="debug_dashboard_core.scanner"
                     )
-                    cls._register_from_module_to(module, checkers)
+                    classes.extend(cls._checker_classes(module))
                 except Exception as e:
                     load_errors.append({"file": f"builtin/{module_name}.py", "error": str(e)})
+        cls._builtin_classes = (classes, load_errors)
+        return cls._builtin_classes
 
-        # 2. Extra plugin directories
-        for d_str in (extra_dirs or []):
-            directory = Path(d_str)
-            if not directory.exists() or not directory.is_dir():
-                continue
-            parent_name = directory.parent.name
-            dir_name = directory.name
+    @classmethod
+    def _discover_dir_classes(cls, directory: Path) -> Optional[Tuple[List[type], List[dict]]]:
+        """Checker classes from one plugin directory (None if it doesn't exist)."""
+        try:
+            st = directory.stat()
+        except OSError:
+            return None
+        if not directory.is_dir():
+            return None
+        key = str(directory)
+        cached = cls._dir_classes.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns:
+            return cached[1], cached[2]
 
-            for py_file in sorted(directory.glob("*.py")):
-                if py_file.stem in ("__init__", "base", "registry"):
-                    continue
-                if py_file.name.startswith("._"):
-                    continue
-                try:
-                    module_name = f"debugger_plugin.{parent_name}.{dir_name}.{py_file.stem}"
-                    # Check if already loaded
-                    if module_name in sys.modules:
-                        module = sys.modules[module_name]
-                    else:
-                        spec = importlib.util.spec_from_file_location(module_name, py_file)
-                        if spec is None or spec.loader is None:
-                            continue
-                        module = importlib.util.module_from_spec(spec)
-                        sys.modules[module_name] = module
-                        spec.loader.exec_module(module)
-                    cls._register_from_module_to(module, checkers)
-                except Exception as e:
-                    load_errors.append({"file": py_file.name, "error": str(e)})
+        classes: List[type] = []
+        load_errors: List[dict] = []
+        parent_name = directory.parent.name
+        dir_name = directory.name
 
-        return checkers, load_errors
+        for py_file in sorted(directory.glob("*.py")):
+            if py_file.stem in ("__init__", "base", "registry"):
+                continue
+            if py_file.name.startswith("._"):
+                continue
+            try:
+                module_name = f"debugger_plugin.{parent_name}.{dir_name}.{py_file.stem}"
+                # Check if already loaded
+                if module_name in sys.modules:
+                    module = sys.modules[module_name]
+                else:
+                    spec = importlib.util.spec_from_file_location(module_name, py_file)
+                    if spec is None or spec.loader is None:
+                        continue
+                    module = importlib.util.module_from_spec(spec)
+                    sys.modules[module_name] = module
+                    spec.loader.exec_module(module)
+                classes.extend(cls._checker_classes(module))
+            except Exception as e:
+                load_errors.append({"file": py_file.name, "error": str(e)})
 
-    @classmethod
-    def _register_from_module_to(cls, module, target_dict: Dict[str, BaseChecker]):
-        """Register BaseChecker subclasses from a module into target_dict."""
+        cls._dir_classes[key] = (st.st_mtime_ns, classes, load_errors)
+        return classes, load_errors
+
+    @staticmethod
+    def _checker_classes(module) -> List[type]:
+        """BaseChecker subclasses defined (or imported) in a module, in dir() order."""
+        classes = []
         for attr_name in dir(module):
             attr = getattr(module, attr_name)
             if (isinstance(attr, type)
@@ -215,4 +263,5 @@ class CheckerRegistry:
                     and attr is not BaseChecker
                     and hasattr(attr, 'name')
                     and attr.name):
-                target_dict[attr.name] = attr()
+                classes.append(attr)
+        return classes
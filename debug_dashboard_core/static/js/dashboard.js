@@ -1522,7 +1522,9 @@
             const d = event.data || {};
             // GPT Review #7-5: precise gap wording — "N개 이벤트 미수신" instead of vague "누락"
             let gapMsg;
-            if (d.dropped_count > 0) {
+            if (d.lagged) {
+              gapMsg = d.message;
+            } else if (d.dropped_count > 0) {
               gapMsg = `SSE 재연결: ${d.replayed || "?"}개 복구, ${d.dropped_count}개 이벤트 미수신 (ID ${d.from_id}~${d.to_id})`;
             } else {
               gapMsg = `SSE 재연결: ${d.replayed || "?"}개 복구. 전체 이력은 History에서 확인하세요.`;
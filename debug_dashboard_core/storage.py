@@ -15,7 +15,7 @@ import json
 import sqlite3
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional, Dict
+from typing import Iterable, List, Optional, Dict, Tuple
 
 
 # Default DB path (can be overridden via configure())
@@ -158,7 +158,7 @@ def get_latest(project_name: str = None) -> Optional[dict]:
 
 def save_agent_event(event_type: str, source: str, data_json: str,
                      workspace_id: str = ""):
-    """Save an agent event to the log."""
+    """Save an agent event to the log (data_json: well-formed JSON text)."""
     conn = _get_conn()
     conn.execute("""
         INSERT INTO agent_events (timestamp, event_type, source, data_json, workspace_id)
@@ -168,6 +168,21 @@ def save_agent_event(event_type: str, source: str, data_json: str,
     conn.close()
 
 
+def save_agent_events(rows: Iterable[Tuple[str, str, str, str, str]]):
+    """Save a batch of agent events in one transaction.
+
+    rows: (timestamp, event_type, source, data_json, workspace_id) tuples.
+    data_json must be well-formed JSON — SSE replay splices it into frames verbatim.
+    """
+    conn = _get_conn()
+    with conn:
+        conn.executemany("""
+            INSERT INTO agent_events (timestamp, event_type, source, data_json, workspace_id)
+            VALUES (?, ?, ?, ?, ?)
+        """, rows)
+    conn.close()
+
+
 def get_agent_events(limit: int = 100, workspace_id: str = "",
                      since_id: int = 0) -> List[dict]:
     """Get recent agent events. Supports SSE reconnect via since_id."""